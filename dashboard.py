@@ -5,31 +5,321 @@ Trading Signals Dashboard
 A web-based dashboard for monitoring and visualizing trading signals.
 """
 import os
-import json
-import glob
-from datetime import datetime, timedelta
-import pandas as pd
-from flask import Flask, render_template, jsonify, request, redirect, url_for
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+import re
+import time
+import heapq
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress
+from operator import itemgetter
+from datetime import datetime, timedelta, timezone
+from flask import Flask, Response, abort, render_template, request, redirect, send_file, url_for
+from flask.json.provider import JSONProvider
 
 # Import project utilities
-from src.utils.config import OUTPUTS_DIR, DEFAULT_SYMBOLS
-from src.utils.file_utils import create_directories
+from src.utils.config import OUTPUTS_DIR, PROCESSED_DATA_DIR, RAW_DATA_DIR, CACHE_DIR, DEFAULT_SYMBOLS
+from src.utils.file_utils import create_directories, json_dumps, json_loads
 
-# Create app
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson (when installed) instead of the stdlib json module."""
+    
+    def dumps(self, obj, **kwargs):
+        return json_dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return json_loads(s)
+
+# Create app; environment and directory setup is deferred to create_app()
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.urandom(24)
+app.json = OrjsonProvider(app)
+app.config['SECRET_KEY'] = os.environ.get('DASHBOARD_SECRET_KEY') or os.urandom(24)
+
+def create_app():
+    """
+    Prepare the dashboard for serving and return the Flask app.
+    
+    Importing this module has no side effects; the .env reload and directory
+    creation run here, once, when the app is actually served.
+    
+    Returns:
+        Flask: The configured dashboard app
+    """
+    # src.utils.config already loads .env on import; only re-read it here when asked to
+    if os.getenv('LOAD_DOTENV'):
+        from dotenv import load_dotenv
+        load_dotenv()
+        if os.getenv('DASHBOARD_SECRET_KEY'):
+            app.config['SECRET_KEY'] = os.environ['DASHBOARD_SECRET_KEY']
+    
+    # Ensure directories exist
+    create_directories()
+    
+    # Invalidate the signal caches as soon as files change, when watchdog is installed
+    _start_signal_watcher()
+    return app
+
+# Client addresses allowed to call the /admin routes
+LOCAL_ADDRESSES = frozenset({'127.0.0.1', '::1'})
+
+# Seconds a cached signal listing is served before it is rebuilt
+SIGNAL_CACHE_TTL = 60
+
+# Directories with at least this many files are filtered by mtime with NumPy
+VECTORIZED_SCAN_MIN_FILES = 1000
+
+# Signal files are read on a thread pool when more than this many are in range
+PARALLEL_READ_MIN_FILES = 16
+SIGNAL_READ_WORKERS = 16
+
+# Signal summaries switch from a plain loop to pandas at this many signals
+PANDAS_SUMMARY_MIN_SIGNALS = 32
+
+# Daily chart counts switch from a plain loop to numpy at this many signals
+NUMPY_COUNTS_MIN_SIGNALS = 32
+
+# Row of each action in the /chart daily count table
+CHART_ACTION_IDS = {'buy': 0, 'sell': 1, 'hold': 2}
+
+# Signal files are named {SYMBOL}_{YYYYMMDD}[_{HHMMSS}]_signal.json; any other
+# {SYMBOL}_..._signal.json name is accepted and dated by its mtime
+_SIGNAL_FILE_RE = re.compile(r'^(?P<sym>[^_]+)_(?:(?P<date>\d{8})(?:_(?P<time>\d{6}))?|.+?)_signal\.json$')
+
+# Prepared chart data is pickled here; the oldest entries are evicted past CHART_CACHE_MAX_FILES
+CHART_CACHE_DIR = os.path.join(CACHE_DIR, 'charts')
+CHART_CACHE_MAX_FILES = 256
+
+# Most recently used chart payloads kept in memory in front of the disk cache
+CHART_MEMORY_CACHE_SIZE = 32
+
+# Bar columns drawn on the price chart, and prefixes of the indicator overlays
+CHART_PRICE_COLUMNS = ('t', 'o', 'h', 'l', 'c', 'v')
+CHART_INDICATOR_PREFIXES = ('sma_', 'ema_', 'bb_', 'rsi', 'macd', 'stoch_')
+
+# Read buffer for processed/raw bar files
+CHART_READ_BUFFER = 1 << 20
+
+# Parsed signal files, keyed by path -> (mtime, signal)
+_signal_file_cache = {}
+
+# Directory listings, keyed by directory -> (directory mtime, scanned at, [(name, path, mtime), ...])
+_dir_listing_cache = {}
+
+# Parsed signals persisted as JSON lines ({path, mtime, signal}) so a restarted
+# process can warm _signal_file_cache without opening every signal file
+SIGNAL_INDEX_FILE = os.path.join(CACHE_DIR, 'signal_index.jsonl')
+SIGNAL_INDEX_SLACK = 64
+_signal_index_lock = threading.Lock()
+_signal_index_loaded = False
+_signal_index_pending = []
+_signal_index_lines = 0
+
+# Filesystem observer started by create_app() when watchdog is installed
+_signal_watcher = None
+
+# Prepared chart data, keyed by disk cache path (which encodes symbol, days_back, and source mtime)
+_chart_memory_cache = OrderedDict()
+
+def _read_signal_file(file_path, mtime):
+    """
+    Load a signal file, reusing the parsed result while its mtime is unchanged.
+    
+    Args:
+        file_path (str): Path to the signal JSON file
+        mtime (float): Current modification time of the file
+    
+    Returns:
+        dict: Parsed signal, as a shallow copy the caller may add keys to
+    """
+    cached = _signal_file_cache.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+    
+    # Unbuffered: a bare read() pulls the whole (small) file in one syscall
+    with open(file_path, 'rb', buffering=0) as f:
+        signal = json_loads(f.read())
+    
+    # Earlier versions of the styled-signal route saved lowercased helper fields
+    if isinstance(signal, dict):
+        signal.pop('_action_lc', None)
+        signal.pop('_confidence_lc', None)
+    
+    _signal_file_cache[file_path] = (mtime, signal)
+    _signal_index_pending.append((file_path, mtime, signal))
+    return dict(signal)
+
+def _seed_from_signal_index():
+    """
+    Warm the parsed-file cache from the signal index on the first load after startup.
+    
+    Only index entries whose mtime still matches the file on disk are used. The
+    index is rewritten once stale lines outnumber the live ones.
+    """
+    global _signal_index_loaded, _signal_index_lines
+    with _signal_index_lock:
+        if _signal_index_loaded:
+            return
+        _signal_index_loaded = True
+        
+        try:
+            with open(SIGNAL_INDEX_FILE, 'rb') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        
+        _signal_index_lines = len(lines)
+        indexed = {}
+        for line in lines:
+            try:
+                record = json_loads(line)
+                indexed[record['path']] = (record['mtime'], record['signal'])
+            except Exception:
+                continue
+        
+        live = {}
+        for _, path, mtime in _scan_directory(OUTPUTS_DIR):
+            entry = indexed.get(path)
+            if entry is not None and entry[0] == mtime:
+                live[path] = entry
+                _signal_file_cache.setdefault(path, entry)
+        
+        if len(lines) > 2 * len(live) + SIGNAL_INDEX_SLACK:
+            _write_signal_index(live.items())
+            _signal_index_lines = len(live)
+
+def _write_signal_index(entries, mode='wb'):
+    """Write (path, (mtime, signal)) entries to the signal index as JSON lines."""
+    payload = b''.join(
+        json_dumps({'path': path, 'mtime': mtime, 'signal': signal}) + b'\n'
+        for path, (mtime, signal) in entries
+    )
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(SIGNAL_INDEX_FILE, mode) as f:
+            f.write(payload)
+    except OSError as e:
+        app.logger.warning(f"Could not write signal index: {e}")
+
+def _flush_signal_index():
+    """
+    Append signals parsed since the last flush to the signal index.
+    
+    Files rewritten while the dashboard runs leave superseded lines behind, so the
+    index is rewritten from the parsed-file cache once those outnumber the live ones.
+    """
+    global _signal_index_lines
+    if not _signal_index_pending:
+        return
+    
+    with _signal_index_lock:
+        pending = []
+        while _signal_index_pending:
+            pending.append(_signal_index_pending.pop())
+        
+        live = list(_signal_file_cache.items())
+        if _signal_index_lines + len(pending) > 2 * len(live) + SIGNAL_INDEX_SLACK:
+            _write_signal_index(live)
+            _signal_index_lines = len(live)
+        else:
+            _write_signal_index(((path, (mtime, signal)) for path, mtime, signal in pending), mode='ab')
+            _signal_index_lines += len(pending)
+
+def _scan_directory(directory):
+    """
+    List the files in a directory with their modification times.
+    
+    The listing is cached until the directory's own mtime changes, which
+    happens whenever a file is added, removed or renamed, or until it is
+    older than SIGNAL_CACHE_TTL (files rewritten in place keep the
+    directory mtime unchanged).
+    
+    Args:
+        directory (str): Directory to scan
+    
+    Returns:
+        list: (name, path, mtime) tuples, in directory order
+    """
+    try:
+        dir_mtime = os.path.getmtime(directory)
+    except OSError:
+        return []
+    
+    now = time.time()
+    cached = _dir_listing_cache.get(directory)
+    if cached is not None and cached[0] == dir_mtime and now - cached[1] < SIGNAL_CACHE_TTL:
+        return cached[2]
+    
+    with os.scandir(directory) as it:
+        entries = [(e.name, e.path, e.stat().st_mtime) for e in it if e.is_file()]
+    
+    # Forget parsed signals whose files are gone, so the cache stays bounded by the
+    # directory even without the watchdog observer
+    if directory == OUTPUTS_DIR:
+        live_paths = {path for _, path, _ in entries}
+        for path in [path for path in list(_signal_file_cache) if path not in live_paths]:
+            _signal_file_cache.pop(path, None)
+    
+    _dir_listing_cache[directory] = (dir_mtime, now, entries)
+    return entries
+
+def _chart_cache_path(symbol, days_back, src_mtime):
+    """Path of the cached chart data for a symbol, window and source file version."""
+    # The UTC date is part of the key so the days_back window still moves forward daily
+    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    key = hashlib.blake2b(f"{symbol}:{days_back}:{src_mtime}:{today}".encode(), digest_size=16).hexdigest()
+    return os.path.join(CHART_CACHE_DIR, f"{key}.pkl")
 
-# Ensure directories exist
-create_directories()
+def _read_chart_cache(cache_path):
+    """Return cached chart data, or None on a miss or unreadable entry."""
+    try:
+        with open(cache_path, 'rb') as f:
+            chart_data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    
+    # Touch the entry so eviction drops the least recently used files first
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return chart_data
+
+def _remember_chart(cache_path, chart_data):
+    """Keep chart data in the in-memory LRU, evicting the least recently used entries."""
+    _chart_memory_cache[cache_path] = chart_data
+    while len(_chart_memory_cache) > CHART_MEMORY_CACHE_SIZE:
+        try:
+            _chart_memory_cache.popitem(last=False)
+        except KeyError:
+            break
+
+def _write_chart_cache(cache_path, chart_data):
+    """Atomically write chart data to the cache and evict old entries."""
+    try:
+        os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CHART_CACHE_DIR, suffix='.tmp', delete=False) as f:
+            pickle.dump(chart_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_path)
+        
+        with os.scandir(CHART_CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith('.pkl')]
+        if len(entries) > CHART_CACHE_MAX_FILES:
+            for _, path in heapq.nsmallest(len(entries) - CHART_CACHE_MAX_FILES, entries):
+                os.remove(path)
+    except OSError as e:
+        app.logger.warning(f"Could not write chart cache {cache_path}: {e}")
 
 def load_signals(days_back=7, symbol=None):
     """
     Load trading signals from the outputs directory.
     
+    Results are cached per (days_back, symbol) until a signal file is added
+    or removed, or SIGNAL_CACHE_TTL seconds have passed.
+    
     Args:
         days_back (int): Number of days to look back
         symbol (str): Filter by symbol (optional)
@@ -37,54 +327,220 @@ def load_signals(days_back=7, symbol=None):
     Returns:
         list: List of signal dictionaries
     """
-    # Get all signal files
-    pattern = f"{symbol}_*_signal.json" if symbol else "*_signal.json"
-    signal_files = glob.glob(os.path.join(OUTPUTS_DIR, pattern))
+    version = _signals_version()
+    if version is None:
+        return []
     
-    # Sort by modification time (newest first)
-    signal_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    return list(_load_signals_cached(days_back, symbol, *version))
+
+def invalidate_signal_cache():
+    """Drop cached signal listings so the next load_signals call rescans OUTPUTS_DIR."""
+    _load_signals_cached.cache_clear()
+    _dashboard_context_cached.cache_clear()
+    _dir_listing_cache.pop(OUTPUTS_DIR, None)
+
+def _start_signal_watcher():
+    """
+    Watch OUTPUTS_DIR and drop cached signals as soon as a file is written or removed.
+    
+    Without this, changes are picked up on the next directory mtime check or TTL expiry.
+    
+    Returns:
+        Observer: The running watchdog observer, or None if watchdog isn't installed
+    """
+    global _signal_watcher
+    if _signal_watcher is not None:
+        return _signal_watcher
+    
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+    
+    class SignalDirHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Opened/closed events fire on every read; only content changes matter
+            if event.is_directory or event.event_type not in ('created', 'modified', 'deleted', 'moved'):
+                return
+            _signal_file_cache.pop(event.src_path, None)
+            invalidate_signal_cache()
+    
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(SignalDirHandler(), OUTPUTS_DIR, recursive=False)
+    observer.start()
+    _signal_watcher = observer
+    return observer
+
+def _signals_version():
+    """
+    Identify the current state of the signal listing.
+    
+    Returns:
+        tuple: (outputs directory mtime, TTL bucket), or None if the directory is missing
+    """
+    try:
+        dir_mtime = os.path.getmtime(OUTPUTS_DIR)
+    except OSError:
+        return None
+    
+    return dir_mtime, int(time.time() // SIGNAL_CACHE_TTL)
+
+@lru_cache(maxsize=64)
+def _load_signals_cached(days_back, symbol, dir_mtime, ttl_bucket):
+    """Uncached body of load_signals; dir_mtime and ttl_bucket only key the cache."""
+    _seed_from_signal_index()
     
     # Calculate cutoff date
     cutoff = datetime.now() - timedelta(days=days_back)
     cutoff_timestamp = cutoff.timestamp()
     
-    signals = []
-    for file_path in signal_files:
-        # Check if the file is within our date range
-        if os.path.getmtime(file_path) >= cutoff_timestamp:
-            try:
-                with open(file_path, 'r') as f:
-                    signal = json.load(f)
-                
-                # Extract symbol from filename
-                filename = os.path.basename(file_path)
-                parts = filename.split('_')
-                if len(parts) >= 1:
-                    signal['symbol'] = parts[0]
-                
-                # Format date from filename or use file modification time
-                if len(parts) >= 2:
-                    try:
-                        date_str = parts[1]
-                        signal['date'] = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                    except:
-                        # Use file modification time if parsing fails
-                        signal['date'] = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d')
-                else:
-                    signal['date'] = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d')
-                
-                signals.append(signal)
-            except Exception as e:
-                print(f"Error loading signal file {file_path}: {e}")
+    # Single scandir pass: filter by date range using the stat taken during the scan
+    entries = _scan_directory(OUTPUTS_DIR)
+    if len(entries) >= VECTORIZED_SCAN_MIN_FILES:
+        # Large directories: select in-range files with one vectorized comparison
+        import numpy as np
+        mtimes = np.fromiter((entry[2] for entry in entries), dtype=np.float64, count=len(entries))
+        in_range = compress(entries, mtimes >= cutoff_timestamp)
+    else:
+        in_range = (entry for entry in entries if entry[2] >= cutoff_timestamp)
+    
+    # Parse names and filter by symbol
+    signal_files = []
+    for name, path, mtime in in_range:
+        parsed = _parse_signal_filename(name)
+        if parsed is not None and (symbol is None or parsed[0] == symbol):
+            if parsed[1] is None:
+                # No date in the name: fall back to the mtime from the scan
+                modified = datetime.fromtimestamp(mtime)
+                parsed = (parsed[0], modified.strftime('%Y-%m-%d'), modified.strftime('%Y%m%d%H%M%S'))
+            signal_files.append((parsed, path, mtime))
+    
+    # Sort only the files in range, newest first by the timestamp in the filename
+    # (mtime breaks ties); get_signals_summary relies on this order
+    signal_files.sort(key=lambda e: (e[0][2], e[2]), reverse=True)
+    
+    # Overlap file reads with a thread pool once there are enough files to pay for it
+    if len(signal_files) > PARALLEL_READ_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=min(SIGNAL_READ_WORKERS, len(signal_files))) as executor:
+            loaded = list(executor.map(_load_signal_entry, signal_files))
+    else:
+        loaded = map(_load_signal_entry, signal_files)
     
+    signals = tuple(signal for signal in loaded if signal is not None)
+    _flush_signal_index()
     return signals
 
+@lru_cache(maxsize=16384)
+def _parse_signal_filename(name):
+    """
+    Split a signal filename into its symbol and display date.
+    
+    Filenames don't change, so each one is parsed and formatted only once.
+    
+    Args:
+        name (str): Filename such as AAPL_20250101_093000_signal.json
+    
+    Returns:
+        tuple: (symbol, 'YYYY-MM-DD', 'YYYYMMDDHHMMSS' sort key), or None if the name isn't
+            a signal file; date and sort key are None when the name carries no date
+    """
+    match = _SIGNAL_FILE_RE.match(name)
+    if match is None:
+        return None
+    
+    date_str = match['date']
+    if date_str is None:
+        return match['sym'], None, None
+    return match['sym'], f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}", date_str + (match['time'] or '000000')
+
+def _load_signal_entry(entry):
+    """
+    Load one signal file and tag it with the symbol and date from its name.
+    
+    Args:
+        entry (tuple): ((symbol, date, stamp), path, mtime) from the directory scan
+    
+    Returns:
+        dict: Signal, or None if the file could not be loaded
+    """
+    (file_symbol, file_date, _), file_path, mtime = entry
+    try:
+        signal = _read_signal_file(file_path, mtime)
+    except Exception as e:
+        print(f"Error loading signal file {file_path}: {e}")
+        return None
+    
+    # Symbol and date come straight from the filename
+    signal['symbol'] = file_symbol
+    signal['date'] = file_date
+    return signal
+
+def _count_signals_python(signals, summary):
+    """Fill the action, confidence, and per-symbol counts of a summary with Counters."""
+    action_counts = Counter()
+    confidence_counts = Counter()
+    by_symbol = defaultdict(Counter)
+    for signal in signals:
+        action = str(signal.get('suggested_action', '')).lower()
+        confidence = str(signal.get('pattern_confidence', '')).lower()
+        symbol = signal.get('symbol')
+        
+        action_counts[action] += 1
+        confidence_counts[confidence] += 1
+        by_symbol['unknown' if symbol is None else symbol][action] += 1
+    
+    for action in ('buy', 'sell', 'hold'):
+        summary[f'{action}_signals'] = action_counts[action]
+    for confidence in ('high', 'medium', 'low'):
+        summary[f'{confidence}_confidence'] = confidence_counts[confidence]
+    for symbol, counts in by_symbol.items():
+        summary['by_symbol'][symbol] = {
+            'total': counts.total(),
+            'buy': counts['buy'],
+            'sell': counts['sell'],
+            'hold': counts['hold']
+        }
+
+def _count_signals_pandas(signals, summary):
+    """Fill the action, confidence, and per-symbol counts of a summary with vectorized pandas reductions."""
+    import pandas as pd
+    df = pd.DataFrame(list(signals), columns=['symbol', 'suggested_action', 'pattern_confidence'])
+    # Categoricals group and count on integer codes instead of re-hashing strings per row
+    actions = df['suggested_action'].astype(str).str.lower().astype('category')
+    symbols = df['symbol'].fillna('unknown').astype('category')
+    
+    action_counts = actions.value_counts()
+    summary['buy_signals'] = int(action_counts.get('buy', 0))
+    summary['sell_signals'] = int(action_counts.get('sell', 0))
+    summary['hold_signals'] = int(action_counts.get('hold', 0))
+    
+    confidence_counts = df['pattern_confidence'].astype(str).str.lower().value_counts()
+    summary['high_confidence'] = int(confidence_counts.get('high', 0))
+    summary['medium_confidence'] = int(confidence_counts.get('medium', 0))
+    summary['low_confidence'] = int(confidence_counts.get('low', 0))
+    
+    # Count by symbol, keeping symbols in order of first appearance
+    symbol_order = symbols.unique()
+    totals = symbols.value_counts()
+    by_symbol = (actions.groupby(symbols, observed=True).value_counts().unstack(fill_value=0)
+                 .reindex(index=symbol_order, columns=['buy', 'sell', 'hold'], fill_value=0))
+    
+    for symbol, row in by_symbol.iterrows():
+        summary['by_symbol'][symbol] = {
+            'total': int(totals[symbol]),
+            'buy': int(row['buy']),
+            'sell': int(row['sell']),
+            'hold': int(row['hold'])
+        }
+
 def get_signals_summary(signals):
     """
     Generate a summary of trading signals.
     
     Args:
-        signals (list): List of signal dictionaries
+        signals (list): List of signal dictionaries, newest first as returned by load_signals
     
     Returns:
         dict: Summary statistics
@@ -101,57 +557,58 @@ def get_signals_summary(signals):
         'recent_signals': []
     }
     
-    for signal in signals:
-        # Count by action
-        action = signal.get('suggested_action', '').lower()
-        if action == 'buy':
-            summary['buy_signals'] += 1
-        elif action == 'sell':
-            summary['sell_signals'] += 1
-        elif action == 'hold':
-            summary['hold_signals'] += 1
-        
-        # Count by confidence
-        confidence = signal.get('pattern_confidence', '').lower()
-        if confidence == 'high':
-            summary['high_confidence'] += 1
-        elif confidence == 'medium':
-            summary['medium_confidence'] += 1
-        elif confidence == 'low':
-            summary['low_confidence'] += 1
-        
-        # Count by symbol
-        symbol = signal.get('symbol', 'unknown')
-        if symbol not in summary['by_symbol']:
-            summary['by_symbol'][symbol] = {
-                'total': 0,
-                'buy': 0,
-                'sell': 0,
-                'hold': 0
-            }
-        
-        summary['by_symbol'][symbol]['total'] += 1
-        if action == 'buy':
-            summary['by_symbol'][symbol]['buy'] += 1
-        elif action == 'sell':
-            summary['by_symbol'][symbol]['sell'] += 1
-        elif action == 'hold':
-            summary['by_symbol'][symbol]['hold'] += 1
-    
-    # Get the most recent signals
-    recent = sorted(signals, key=lambda x: x.get('date', ''), reverse=True)[:5]
-    summary['recent_signals'] = recent
+    if not signals:
+        return summary
+    
+    # pandas has a fixed per-DataFrame cost that only pays off past a few dozen rows
+    if len(signals) < PANDAS_SUMMARY_MIN_SIGNALS:
+        _count_signals_python(signals, summary)
+    else:
+        _count_signals_pandas(signals, summary)
+    
+    # load_signals returns signals newest first, so the most recent are simply the head
+    summary['recent_signals'] = signals[:5]
     
     return summary
 
+def _dashboard_context(days, symbol):
+    """
+    Load signals and their summary for a dashboard page.
+    
+    Both are cached on the same version as load_signals, so pages that share a
+    (days, symbol) pair reuse one summary until a signal file changes.
+    
+    Args:
+        days (int): Number of days to look back
+        symbol (str): Filter by symbol (optional)
+    
+    Returns:
+        tuple: (list of signals, summary dict)
+    """
+    version = _signals_version()
+    if version is None:
+        return [], get_signals_summary([])
+    
+    signals, summary = _dashboard_context_cached(days, symbol, *version)
+    return list(signals), summary
+
+@lru_cache(maxsize=64)
+def _dashboard_context_cached(days, symbol, dir_mtime, ttl_bucket):
+    """Uncached body of _dashboard_context; dir_mtime and ttl_bucket only key the cache."""
+    signals = _load_signals_cached(days, symbol, dir_mtime, ttl_bucket)
+    return signals, get_signals_summary(list(signals))
+
+def _json_response(obj):
+    """Serialize obj straight to a JSON response, skipping jsonify's provider round trip."""
+    return app.response_class(json_dumps(obj), mimetype='application/json')
+
 @app.route('/')
 def index():
     """Dashboard home page."""
     days = request.args.get('days', default=7, type=int)
     symbol = request.args.get('symbol', default=None)
     
-    signals = load_signals(days_back=days, symbol=symbol)
-    summary = get_signals_summary(signals)
+    signals, summary = _dashboard_context(days, symbol)
     
     return render_template(
         'index.html',
@@ -168,16 +625,31 @@ def get_signals():
     days = request.args.get('days', default=7, type=int)
     symbol = request.args.get('symbol', default=None)
     
+    # The ETag follows the same version load_signals caches on, so polling
+    # clients get an empty 304 until a signal file changes or the TTL rolls over
+    version = _signals_version()
+    if version is None:
+        return _json_response([])
+    
+    dir_mtime, ttl_bucket = version
+    etag = f"{dir_mtime:.6f}-{ttl_bucket}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    
     signals = load_signals(days_back=days, symbol=symbol)
-    return jsonify(signals)
+    response = _json_response(signals)
+    response.set_etag(etag, weak=True)
+    response.last_modified = dir_mtime
+    return response
 
 @app.route('/signals/<symbol>')
 def get_symbol_signals(symbol):
     """Page to view signals for a specific symbol."""
     days = request.args.get('days', default=7, type=int)
     
-    signals = load_signals(days_back=days, symbol=symbol)
-    summary = get_signals_summary(signals)
+    signals, summary = _dashboard_context(days, symbol)
     
     return render_template(
         'symbol.html',
@@ -188,40 +660,112 @@ def get_symbol_signals(symbol):
         symbols=DEFAULT_SYMBOLS
     )
 
-@app.route('/chart')
-def chart():
-    """Page with interactive charts."""
-    days = request.args.get('days', default=30, type=int)
+def daily_signal_counts(signals):
+    """
+    Count signals per day and action for the charts page.
     
-    signals = load_signals(days_back=days)
+    Args:
+        signals (list): List of signal dictionaries
     
-    # Prepare data for charts
-    df = pd.DataFrame(signals)
+    Returns:
+        dict: 'dates' plus one aligned count list per action
+    """
+    chart_data = {'dates': [], 'buy': [], 'sell': [], 'hold': []}
+    
+    rows = []
+    for signal in signals:
+        action_id = CHART_ACTION_IDS.get(str(signal.get('suggested_action', '')).lower())
+        if action_id is not None and signal.get('date'):
+            rows.append((signal['date'], action_id))
     
-    # Create a date index if possible
-    if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
+    if 0 < len(rows) < NUMPY_COUNTS_MIN_SIGNALS:
+        # Tiny inputs: a dict of Counters beats importing and dispatching to numpy
+        by_date = defaultdict(Counter)
+        for date, action_id in rows:
+            by_date[date][action_id] += 1
         
-        # Daily signal counts
-        daily_counts = df.groupby([df['date'].dt.date, 'suggested_action']).size().unstack().fillna(0)
+        chart_data['dates'] = sorted(by_date)
+        for action, action_id in CHART_ACTION_IDS.items():
+            chart_data[action] = [by_date[date][action_id] for date in chart_data['dates']]
+    elif rows:
+        import numpy as np
+        dates, actions = zip(*rows)
+        day_numbers = np.array(dates, dtype='datetime64[D]').view(np.int64)
         
-        # Convert to chart data format
-        chart_data = {
-            'dates': [d.strftime('%Y-%m-%d') for d in daily_counts.index],
-            'buy': daily_counts['buy'].tolist() if 'buy' in daily_counts.columns else [],
-            'sell': daily_counts['sell'].tolist() if 'sell' in daily_counts.columns else [],
-            'hold': daily_counts['hold'].tolist() if 'hold' in daily_counts.columns else []
-        }
-    else:
-        chart_data = {'dates': [], 'buy': [], 'sell': [], 'hold': []}
+        # One bincount over a combined (day, action) code fills the whole day x action table
+        days_seen, day_index = np.unique(day_numbers, return_inverse=True)
+        n_actions = len(CHART_ACTION_IDS)
+        codes = day_index * n_actions + np.array(actions, dtype=np.int64)
+        table = np.bincount(codes, minlength=len(days_seen) * n_actions).reshape(len(days_seen), n_actions).T
+        
+        chart_data['dates'] = np.datetime_as_string(days_seen.astype('datetime64[D]')).tolist()
+        for action, action_id in CHART_ACTION_IDS.items():
+            chart_data[action] = table[action_id].tolist()
+    
+    return chart_data
+
+@app.route('/chart')
+def chart():
+    """Page with interactive charts; the data is served separately by /chart/data."""
+    days = request.args.get('days', default=30, type=int)
     
     return render_template(
         'chart.html',
-        chart_data=json.dumps(chart_data),
+        chart_data_url=url_for('chart_data', days=days),
         days=days
     )
 
+@app.route('/chart/data')
+def chart_data():
+    """API endpoint with daily signal counts for the charts page."""
+    days = request.args.get('days', default=30, type=int)
+    
+    signals = load_signals(days_back=days)
+    
+    response = _json_response(daily_signal_counts(signals))
+    response.headers['Cache-Control'] = 'public, max-age=60, stale-while-revalidate=60'
+    return response
+
+def _find_signal_file(symbol, signal_id):
+    """
+    Locate the saved signal file for a symbol and signal ID.
+    
+    Args:
+        symbol (str): The stock symbol
+        signal_id (str): The signal ID or timestamp
+    
+    Returns:
+        str: Path to the signal file, or None if not found
+    """
+    # Find the signal file based on the ID
+    signal_file = os.path.join(OUTPUTS_DIR, f"{symbol}_{signal_id}_signal.json")
+    if os.path.exists(signal_file):
+        return signal_file
+    
+    # Search the cached directory scan for {symbol}_*{signal_id}*.json, newest first
+    prefix = f"{symbol}_"
+    matching_files = [(mtime, path) for name, path, mtime in _scan_directory(OUTPUTS_DIR)
+                      if name.startswith(prefix) and name.endswith('.json')
+                      and signal_id in name[len(prefix):-len('.json')]]
+    return max(matching_files)[1] if matching_files else None
+
+@app.route('/signal/<symbol>/<signal_id>.json')
+def download_signal(symbol, signal_id):
+    """
+    Serve the raw signal JSON file straight from disk.
+    
+    Args:
+        symbol (str): The stock symbol
+        signal_id (str): The signal ID or timestamp
+    """
+    signal_file = _find_signal_file(symbol, signal_id)
+    if not signal_file:
+        abort(404)
+    
+    # send_file streams the file and answers Range/If-Modified-Since itself
+    return send_file(signal_file, mimetype='application/json', conditional=True,
+                     last_modified=os.path.getmtime(signal_file))
+
 @app.route('/signal/<symbol>/<signal_id>')
 def view_signal_detail(symbol, signal_id):
     """
@@ -232,24 +776,15 @@ def view_signal_detail(symbol, signal_id):
         signal_id (str): The signal ID or timestamp
     """
     try:
-        # Find the signal file based on the ID
-        signal_file = None
-        if os.path.exists(os.path.join(OUTPUTS_DIR, f"{symbol}_{signal_id}_signal.json")):
-            signal_file = os.path.join(OUTPUTS_DIR, f"{symbol}_{signal_id}_signal.json")
-        else:
-            # Search for files matching the pattern
-            pattern = os.path.join(OUTPUTS_DIR, f"{symbol}_*{signal_id}*.json")
-            matching_files = glob.glob(pattern)
-            if matching_files:
-                signal_file = matching_files[0]
+        signal_file = _find_signal_file(symbol, signal_id)
         
-        if not signal_file or not os.path.exists(signal_file):
+        if not signal_file:
             flash(f"Signal not found for {symbol}", "danger")
             return redirect(url_for('get_symbol_signals', symbol=symbol))
         
         # Load the signal
-        with open(signal_file, 'r') as f:
-            signal = json.load(f)
+        with open(signal_file, 'rb', buffering=0) as f:
+            signal = json_loads(f.read())
         
         # Get chart data for this symbol
         chart_data = prepare_chart_data(symbol)
@@ -300,6 +835,153 @@ def view_signal_detail(symbol, signal_id):
         flash(f"Error viewing signal detail: {str(e)}", "danger")
         return redirect(url_for('get_symbol_signals', symbol=symbol))
 
+def bars_records_to_columns(bars, columns=None):
+    """
+    Transpose a list of bar records into a dict of column tuples.
+    
+    Args:
+        bars (list): Bar dictionaries, all sharing the same keys
+        columns (list): Columns to extract (default: keys of the first bar)
+    
+    Returns:
+        dict: Mapping of column name to a tuple of values
+    """
+    if not bars:
+        return {}
+    
+    if columns is None:
+        columns = list(bars[0].keys())
+    
+    # itemgetter pulls every column of a bar in one C call; zip(*) does the transpose.
+    # The tuples zip produces are kept as-is: orjson and pickle serialize them like
+    # lists, so copying each column into a list would only add allocations.
+    getter = itemgetter(*columns)
+    if len(columns) == 1:
+        return {columns[0]: tuple(map(getter, bars))}
+    return dict(zip(columns, zip(*map(getter, bars))))
+
+def _bar_time_cutoff(sample, cutoff):
+    """
+    Express a cutoff datetime in the same form as a bar's raw 't' value.
+    
+    Args:
+        sample: A bar timestamp: an ISO-8601 UTC string, a numeric epoch, or a datetime
+        cutoff (datetime): Timezone-aware cutoff
+    
+    Returns:
+        str, float, or datetime: Value that compares directly against raw 't' values
+    """
+    if isinstance(sample, (int, float)):
+        # Pick the epoch unit from the magnitude: s ~1e9, ms ~1e12, us ~1e15, ns ~1e18
+        seconds = cutoff.timestamp()
+        for scale in (1e9, 1e6, 1e3):
+            if sample > seconds * scale / 10:
+                return seconds * scale
+        return seconds
+    
+    if isinstance(sample, datetime):
+        # Parsed timestamps (e.g. Parquet datetime columns) compare against a datetime directly
+        return cutoff if sample.tzinfo is not None else cutoff.replace(tzinfo=None)
+    
+    # ISO-8601 UTC strings compare correctly as plain strings
+    return cutoff.strftime('%Y-%m-%dT%H:%M:%S')
+
+def _read_parquet_columns(parquet_path, src_mtime, cutoff):
+    """
+    Load the charted columns of a bars Parquet file, filtered to the cutoff.
+    
+    Args:
+        parquet_path (str): Parquet sibling of the bars JSON file
+        src_mtime (float): Modification time of the JSON file
+        cutoff (datetime): Timezone-aware cutoff for recent bars
+    
+    Returns:
+        dict: Mapping of column name to values (numpy arrays for numeric columns),
+            or None to fall back to JSON
+    """
+    try:
+        if os.path.getmtime(parquet_path) < src_mtime:
+            return None
+    except OSError:
+        return None
+    
+    try:
+        import pandas as pd
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    
+    # Project only the price and indicator columns the chart uses
+    names = pq.read_schema(parquet_path).names
+    wanted = [name for name in names
+              if name in CHART_PRICE_COLUMNS or name.startswith(CHART_INDICATOR_PREFIXES)]
+    if 't' not in wanted:
+        return None
+    
+    df = pd.read_parquet(parquet_path, columns=wanted)
+    if df.empty:
+        return None
+    
+    # Filter by date; if that leaves nothing, use all data
+    times = df['t']
+    recent = times >= _bar_time_cutoff(times.iloc[:1].tolist()[0], cutoff)
+    if recent.any():
+        df = df[recent]
+    
+    # Numeric columns stay as numpy arrays; json_dumps serializes them without a list copy
+    return {name: values.to_numpy() if pd.api.types.is_numeric_dtype(values) else values.tolist()
+            for name, values in df.items()}
+
+def _read_recent_json_bars(file_path, cutoff):
+    """
+    Load the bars of a JSON data file that fall on or after the cutoff.
+    
+    With ijson installed the bars are stream-parsed and filtered as they are read,
+    so the older part of a long history is never held in memory.
+    
+    Args:
+        file_path (str): Processed or raw bars JSON file
+        cutoff (datetime): Timezone-aware cutoff for recent bars
+    
+    Returns:
+        list: Recent bars, all bars if none are recent, or None if the file has no bars
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+    
+    if ijson is not None:
+        recent_bars = []
+        cutoff_val = None
+        # Bar histories can be large; read them through a 1 MiB buffer
+        with open(file_path, 'rb', buffering=CHART_READ_BUFFER) as f:
+            for bar in ijson.items(f, 'bars.item', use_float=True):
+                if cutoff_val is None:
+                    # Compare raw timestamps against a cutoff in the same representation, so no bar is parsed
+                    cutoff_val = _bar_time_cutoff(bar['t'], cutoff)
+                if bar['t'] >= cutoff_val:
+                    recent_bars.append(bar)
+        
+        if recent_bars or cutoff_val is None:
+            return recent_bars or None
+        # Nothing recent: fall through and load all bars
+    
+    # Bar histories can be large; read them through a 1 MiB buffer
+    with open(file_path, 'rb', buffering=CHART_READ_BUFFER) as f:
+        data = json_loads(f.read())
+    
+    if not data or 'bars' not in data or not data['bars']:
+        return None
+    
+    bars = data['bars']
+    
+    # Compare raw timestamps against a cutoff in the same representation, so no bar is parsed
+    cutoff_val = _bar_time_cutoff(bars[0]['t'], cutoff)
+    
+    # Filter by date; if that leaves nothing, use all data
+    return [bar for bar in bars if bar['t'] >= cutoff_val] or bars
+
 def prepare_chart_data(symbol, days_back=7):
     """
     Prepare chart data for a symbol.
@@ -313,67 +995,104 @@ def prepare_chart_data(symbol, days_back=7):
     """
     try:
         # Find the latest processed data file for this symbol
-        pattern = os.path.join(PROCESSED_DATA_DIR, f"{symbol}_*_processed*.json")
-        files = glob.glob(pattern)
+        prefix = f"{symbol}_"
+        files = [(path, mtime) for name, path, mtime in _scan_directory(PROCESSED_DATA_DIR)
+                 if name.startswith(prefix) and '_processed' in name and name.endswith('.json')]
         
         if not files:
             # If no processed data, try raw data
-            pattern = os.path.join(RAW_DATA_DIR, f"{symbol}_*.json")
-            files = glob.glob(pattern)
+            files = [(path, mtime) for name, path, mtime in _scan_directory(RAW_DATA_DIR)
+                     if name.startswith(prefix) and name.endswith('.json')]
         
         if not files:
             return None
         
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        
-        # Load the most recent file
-        with open(files[0], 'r') as f:
-            data = json.load(f)
-        
-        if not data or 'bars' not in data or not data['bars']:
-            return None
-        
-        # Calculate cutoff date
-        cutoff = datetime.now() - timedelta(days=days_back)
+        # Only the newest file is needed, so take the max instead of sorting
+        latest_file, src_mtime = max(files, key=lambda f: f[1])
         
-        # Convert to DataFrame for easier filtering
-        df = pd.DataFrame(data['bars'])
-        
-        # Convert timestamp to datetime for filtering
-        df['datetime'] = pd.to_datetime(df['t'])
+        # Serve from the disk cache while the source file is unchanged
+        cache_path = _chart_cache_path(symbol, days_back, src_mtime)
+        chart_data = _chart_memory_cache.get(cache_path)
+        if chart_data is None:
+            chart_data = _read_chart_cache(cache_path)
+            if chart_data is not None:
+                _remember_chart(cache_path, chart_data)
+        else:
+            try:
+                _chart_memory_cache.move_to_end(cache_path)
+            except KeyError:
+                pass
+        if chart_data is not None:
+            # Shallow copy: callers add top-level keys such as 'signals'
+            return dict(chart_data)
         
-        # Filter by date
-        recent_df = df[df['datetime'] >= cutoff]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
         
-        if recent_df.empty:
-            # If filtering results in empty dataframe, use all data
-            recent_df = df
+        # Prefer the columnar Parquet copy of the bars when one is up to date
+        columns = _read_parquet_columns(os.path.splitext(latest_file)[0] + '.parquet', src_mtime, cutoff)
         
-        # Convert back to format suitable for Plotly
+        if columns is None:
+            recent_bars = _read_recent_json_bars(latest_file, cutoff)
+            if not recent_bars:
+                return None
+            
+            # Build the column lists Plotly expects in a single transpose of the bar records
+            columns = bars_records_to_columns(recent_bars)
         chart_data = {
-            'datetime': recent_df['t'].tolist(),
+            'datetime': columns['t'],
             'price': {
-                'open': recent_df['o'].tolist(),
-                'high': recent_df['h'].tolist(),
-                'low': recent_df['l'].tolist(),
-                'close': recent_df['c'].tolist(),
-                'volume': recent_df['v'].tolist() if 'v' in recent_df.columns else []
+                'open': columns['o'],
+                'high': columns['h'],
+                'low': columns['l'],
+                'close': columns['c'],
+                'volume': columns.get('v', ())
             },
             'indicators': {}
         }
         
         # Add technical indicators if available
-        indicator_columns = [col for col in recent_df.columns if col.startswith(('sma_', 'ema_', 'bb_', 'rsi', 'macd', 'stoch_'))]
+        indicator_columns = [col for col in columns if col.startswith(CHART_INDICATOR_PREFIXES)]
         for col in indicator_columns:
-            chart_data['indicators'][col] = recent_df[col].tolist()
+            chart_data['indicators'][col] = columns[col]
         
-        return chart_data
+        _write_chart_cache(cache_path, chart_data)
+        _remember_chart(cache_path, chart_data)
+        return dict(chart_data)
         
     except Exception as e:
         app.logger.error(f"Error preparing chart data: {e}")
         return None
 
+@lru_cache(maxsize=None)
+def _signal_pipeline():
+    """
+    Import the signal generation pipeline once, on first use.
+    
+    These modules pull in TA-Lib and the OpenAI client, so they stay out of the
+    dashboard's import path but are resolved only once rather than per request.
+    
+    Returns:
+        dict: Prompt preparers by trading style plus the fetch/analysis/signal functions
+    """
+    from prompts.intraday_prompt import (
+        prepare_short_term_prompt, prepare_medium_term_prompt, prepare_long_term_prompt
+    )
+    from data.tradingview import fetch_intraday_data
+    from signals.llm_cache import cached_get_trading_signal
+    from src.analysis.technical import calculate_technical_indicators, get_timeframe_adjusted_settings
+    
+    return {
+        'preparers': {
+            'short_term': prepare_short_term_prompt,
+            'medium_term': prepare_medium_term_prompt,
+            'long_term': prepare_long_term_prompt
+        },
+        'fetch_intraday_data': fetch_intraday_data,
+        'get_trading_signal': cached_get_trading_signal,
+        'calculate_technical_indicators': calculate_technical_indicators,
+        'get_timeframe_adjusted_settings': get_timeframe_adjusted_settings
+    }
+
 @app.route('/generate/<trading_style>')
 def generate_styled_signal(trading_style):
     """
@@ -391,31 +1110,22 @@ def generate_styled_signal(trading_style):
         return redirect(url_for('scan'))
     
     try:
-        # Import the appropriate prompt generator based on trading style
-        if trading_style == 'short_term':
-            from prompts.intraday_prompt import prepare_short_term_prompt as prepare_prompt
-        elif trading_style == 'long_term':
-            from prompts.intraday_prompt import prepare_long_term_prompt as prepare_prompt
-        else:
-            # Default to medium term
-            from prompts.intraday_prompt import prepare_medium_term_prompt as prepare_prompt
+        pipeline = _signal_pipeline()
         
-        # Import other required functions
-        from data.tradingview import fetch_intraday_data
-        from signals.llm_signals import get_trading_signal
-        from src.analysis.technical import calculate_technical_indicators, get_timeframe_adjusted_settings
+        # Pick the prompt generator for the trading style, defaulting to medium term
+        prepare_prompt = pipeline['preparers'].get(trading_style, pipeline['preparers']['medium_term'])
         
         # Get timeframe-adjusted settings
-        indicator_settings = get_timeframe_adjusted_settings(interval)
+        indicator_settings = pipeline['get_timeframe_adjusted_settings'](interval)
         
         # Fetch and process data
-        data = fetch_intraday_data(symbol, interval, period)
+        data = pipeline['fetch_intraday_data'](symbol, interval, period)
         if not data:
             flash(f"Failed to fetch data for {symbol}", "danger")
             return redirect(url_for('scan'))
         
         # Calculate technical indicators
-        data = calculate_technical_indicators(data, indicator_settings)
+        data = pipeline['calculate_technical_indicators'](data, indicator_settings)
         
         # Prepare the prompt using the specific trading style
         prompt = prepare_prompt(data, symbol, interval)
@@ -424,7 +1134,7 @@ def generate_styled_signal(trading_style):
             return redirect(url_for('scan'))
         
         # Get trading signal
-        trading_signal = get_trading_signal(prompt)
+        trading_signal = pipeline['get_trading_signal'](prompt)
         if not trading_signal:
             flash(f"Failed to generate signal for {symbol}", "danger")
             return redirect(url_for('scan'))
@@ -440,8 +1150,9 @@ def generate_styled_signal(trading_style):
         # Save the signal
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         file_path = os.path.join(OUTPUTS_DIR, f"{symbol}_{timestamp}_signal.json")
-        with open(file_path, 'w') as f:
-            json.dump(trading_signal, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(json_dumps(trading_signal, indent=True))
+        invalidate_signal_cache()
         
         # Extract signal ID from file path
         signal_id = timestamp
@@ -523,6 +1234,8 @@ def scan():
                 )
                 
                 if result:
+                    invalidate_signal_cache()
+                    
                     # If we have a signal ID in the metadata, use that
                     signal_id = result.get('metadata', {}).get('timestamp', datetime.now().strftime('%Y%m%d_%H%M%S'))
                     
@@ -552,22 +1265,39 @@ def scan():
     # GET request
     return render_template('scan.html', symbols=DEFAULT_SYMBOLS)
 
+@app.route('/admin/flush_cache', methods=['POST'])
+def flush_cache():
+    """
+    Drop the cached signal listings, e.g. after signal files were written by another process.
+    
+    Only accepted from the local machine, since the dashboard has no login.
+    """
+    if request.remote_addr not in LOCAL_ADDRESSES:
+        abort(403)
+    invalidate_signal_cache()
+    return _json_response({'flushed': True})
+
 # Add some filters needed for the templates
 @app.template_filter('tojson')
 def tojson_filter(obj):
-    return json.dumps(obj)
+    return json_dumps(obj).decode()
 
 @app.template_filter('format_date')
 def format_date(value):
     """Format date for display."""
     if isinstance(value, str):
-        try:
-            dt = datetime.strptime(value, '%Y-%m-%d')
-            return dt.strftime('%b %d, %Y')
-        except:
-            return value
+        return _fmt(value)
     return value
 
+@lru_cache(maxsize=4096)
+def _fmt(value: str) -> str:
+    """Parse and reformat a YYYY-MM-DD date once per distinct value."""
+    try:
+        dt = datetime.strptime(value, '%Y-%m-%d')
+        return dt.strftime('%b %d, %Y')
+    except ValueError:
+        return value
+
 if __name__ == '__main__':
     import argparse
     
@@ -578,5 +1308,6 @@ if __name__ == '__main__':
     
     args = parser.parse_args()
     
+    app = create_app()
     print(f"Starting Trading Signals Dashboard on http://{args.host}:{args.port}")
     app.run(host=args.host, port=args.port, debug=args.debug)
\ No newline at end of file
@@ -7,17 +7,17 @@ It can be run with command-line arguments for different symbols, intervals, peri
 and custom indicator settings.
 """
 import os
+import logging
 import argparse
-import json
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
-from data.tradingview import fetch_intraday_data
-from prompts.intraday_prompt import prepare_medium_term_prompt
-from signals.llm_signals import get_trading_signal
-from src.utils.file_utils import create_directories
+from src.utils.async_writer import enqueue_write
+from src.utils.file_utils import create_directories, json_dumps
 from src.utils.logger import main_logger
-from src.analysis.technical import calculate_technical_indicators, get_timeframe_adjusted_settings
 from src.utils.config import DEFAULT_SYMBOLS, DEFAULT_INTERVAL, DEFAULT_PERIOD
 from src.utils.config import TECHNICAL_SETTINGS, OUTPUTS_DIR
 
@@ -27,8 +27,67 @@ create_directories()
 # Load environment variables
 load_dotenv()
 
+# Upper bound on symbols processed concurrently by process_multiple_symbols
+MAX_SYMBOL_WORKERS = 8
+
+# Summary field name -> signal key, for the per-symbol entries in the run summary
+SUMMARY_FIELDS = (
+    ("action", "suggested_action"),
+    ("confidence", "pattern_confidence"),
+    ("pattern", "pattern_identified")
+)
+
+@lru_cache(maxsize=None)
+def _signal_pipeline():
+    """
+    Import the data, analysis and LLM modules once, on first use.
+    
+    They pull in pandas, TA-Lib and the OpenAI client, so keeping them out of the
+    module imports lets --help and argument errors return without loading them.
+    
+    Returns:
+        dict: Prompt preparers by trading style plus the fetch/analysis/signal functions
+    """
+    from data.tradingview import fetch_intraday_data, fetch_intraday_data_batch
+    from prompts.intraday_prompt import (
+        prepare_short_term_prompt, prepare_medium_term_prompt, prepare_long_term_prompt
+    )
+    from signals.llm_cache import cached_get_trading_signal
+    from signals.llm_signals import save_trading_signal
+    from src.analysis.technical import calculate_technical_indicators, get_timeframe_adjusted_settings
+    
+    return {
+        'preparers': {
+            'short_term': prepare_short_term_prompt,
+            'medium_term': prepare_medium_term_prompt,
+            'long_term': prepare_long_term_prompt
+        },
+        'fetch_intraday_data': fetch_intraday_data,
+        'fetch_intraday_data_batch': fetch_intraday_data_batch,
+        'get_trading_signal': cached_get_trading_signal,
+        'save_trading_signal': save_trading_signal,
+        'calculate_technical_indicators': calculate_technical_indicators,
+        'get_timeframe_adjusted_settings': get_timeframe_adjusted_settings
+    }
+
+# Signal fields shown in logs and console output, with the placeholder for missing ones
+_SIGNAL_DISPLAY_FIELDS = (
+    ('suggested_action', 'unknown'),
+    ('pattern_identified', 'unknown'),
+    ('pattern_confidence', 'unknown'),
+    ('entry_price', 'N/A'),
+    ('stop_loss', 'N/A'),
+    ('take_profit', 'N/A')
+)
+SignalFields = namedtuple('SignalFields', [name for name, _ in _SIGNAL_DISPLAY_FIELDS])
+
+def _signal_fields(signal):
+    """Read a signal's display fields in one pass, filling in placeholders."""
+    return SignalFields(*(signal.get(name, default) for name, default in _SIGNAL_DISPLAY_FIELDS))
+
 def process_symbol(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD, 
-                  with_technical=True, execute=False, indicator_settings=None, trading_style="medium_term"):
+                  with_technical=True, execute=False, indicator_settings=None, trading_style="medium_term",
+                  prefetched_data=None, run_timestamp=None):
     """
     Process a single symbol to generate trading signals.
     
@@ -40,53 +99,53 @@ def process_symbol(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD,
         execute (bool): Whether to execute trades based on signals
         indicator_settings (dict): Custom technical indicator settings
         trading_style (str): 'short_term', 'medium_term', or 'long_term'
+        prefetched_data (dict): Bars already fetched for this symbol; skips the fetch step
+        run_timestamp (datetime): Start time of the run, shared by every signal it produces
     
     Returns:
         dict: Generated trading signal or None if error
     """
     try:
-        main_logger.info(f"Processing {symbol} at {interval} interval for {period} period with {trading_style} style")
+        main_logger.info("Processing %s at %s interval for %s period with %s style", symbol, interval, period, trading_style)
+        pipeline = _signal_pipeline()
         
-        # Step 1: Fetch data
-        data = fetch_intraday_data(symbol, interval, period)
+        # Step 1: Fetch data (the raw copy is redundant when the processed file is saved)
+        data = prefetched_data
+        if data is None:
+            data = pipeline['fetch_intraday_data'](symbol, interval, period, save_intermediate=not with_technical)
         if not data:
-            main_logger.error(f"Failed to fetch data for {symbol}")
+            main_logger.error("Failed to fetch data for %s", symbol)
             return None
         
         # Step 2: Perform technical analysis if requested
         if with_technical:
-            main_logger.info(f"Calculating technical indicators for {symbol}")
+            main_logger.info("Calculating technical indicators for %s", symbol)
             
             # Use custom indicator settings if provided or get timeframe-adjusted settings
             if indicator_settings:
                 settings_to_use = indicator_settings
             else:
-                settings_to_use = get_timeframe_adjusted_settings(interval)
+                settings_to_use = pipeline['get_timeframe_adjusted_settings'](interval)
                 
-            data = calculate_technical_indicators(data, settings_to_use)
+            data = pipeline['calculate_technical_indicators'](data, settings_to_use)
         
-        # Step 3: Prepare LLM prompt based on trading style
-        if trading_style == "short_term":
-            prompt = prepare_short_term_prompt(data, symbol, interval)
-        elif trading_style == "long_term":
-            prompt = prepare_long_term_prompt(data, symbol, interval)
-        else:
-            # Default to medium term
-            prompt = prepare_medium_term_prompt(data, symbol, interval)
+        # Step 3: Prepare LLM prompt based on trading style, defaulting to medium term
+        prepare_prompt = pipeline['preparers'].get(trading_style, pipeline['preparers']['medium_term'])
+        prompt = prepare_prompt(data, symbol, interval)
             
         if not prompt:
-            main_logger.error(f"Failed to prepare prompt for {symbol}")
+            main_logger.error("Failed to prepare prompt for %s", symbol)
             return None
         
         # Step 4: Get trading signal
-        trading_signal = get_trading_signal(prompt)
+        trading_signal = pipeline['get_trading_signal'](prompt)
         
         if trading_signal:
-            main_logger.info(f"Generated trading signal for {symbol}")
-            main_logger.info(f"Action: {trading_signal.get('suggested_action', 'unknown')}")
+            main_logger.info("Generated trading signal for %s", symbol)
+            main_logger.info("Action: %s", trading_signal.get('suggested_action', 'unknown'))
             
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = (run_timestamp or datetime.now()).strftime('%Y%m%d_%H%M%S')
             if isinstance(trading_signal, dict):
                 trading_signal.setdefault('metadata', {}).update({
                     'interval': interval,
@@ -95,9 +154,12 @@ def process_symbol(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD,
                     'trading_style': trading_style,
                     'timestamp': timestamp  # Add timestamp for referencing this specific signal
                 })
+                main_logger.info("Trading signal metadata updated for %s", symbol)
                 
-                # Log the saved file path but don't save again
-                main_logger.info(f"Trading signal metadata updated for {symbol}")
+                # Save here rather than in get_trading_signal so cache hits are recorded too;
+                # text fallbacks carry an 'error' and were never saved
+                if 'error' not in trading_signal:
+                    pipeline['save_trading_signal'](trading_signal, timestamp)
             
             # Step 5: Execute trade if requested (and implemented)
             if execute:
@@ -109,11 +171,12 @@ def process_symbol(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD,
         return trading_signal
     
     except Exception as e:
-        main_logger.error(f"Error processing {symbol}: {e}")
+        main_logger.error("Error processing %s: %s", symbol, e)
         return None
 
 def process_multiple_symbols(symbols, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD, 
-                           with_technical=True, execute=False, indicator_settings=None, trading_style="medium_term"):
+                           with_technical=True, execute=False, indicator_settings=None, trading_style="medium_term",
+                           run_timestamp=None):
     """
     Process multiple symbols to generate trading signals.
     
@@ -125,46 +188,76 @@ def process_multiple_symbols(symbols, interval=DEFAULT_INTERVAL, period=DEFAULT_
         execute (bool): Whether to execute trades based on signals
         indicator_settings (dict): Custom technical indicator settings
         trading_style (str): 'short_term', 'medium_term', or 'long_term'
+        run_timestamp (datetime): Start time of the run; defaults to now
     
     Returns:
         dict: Dictionary mapping symbols to their trading signals
     """
+    # One stamp for the whole run so the signals and the summary all agree
+    if run_timestamp is None:
+        run_timestamp = datetime.now()
+    
+    # A single symbol needs no batch fetch, thread pool or summary file
+    if len(symbols) == 1:
+        signal = process_symbol(symbols[0], interval, period, with_technical, execute, indicator_settings,
+                                trading_style, run_timestamp=run_timestamp)
+        return {symbols[0]: signal} if signal else {}
+    
+    # Fetch every symbol's bars in one request up front; anything the batch misses
+    # falls back to a per-symbol fetch inside process_symbol
+    prefetched = _signal_pipeline()['fetch_intraday_data_batch'](symbols, interval, period, save_intermediate=not with_technical) if symbols else {}
+    
+    # Each symbol is then dominated by the LLM call, so run them on a thread pool;
+    # map() keeps results in the order the symbols were given
+    def process(symbol):
+        return process_symbol(symbol, interval, period, with_technical, execute, indicator_settings, trading_style,
+                              prefetched_data=prefetched.get(symbol), run_timestamp=run_timestamp)
+    
     results = {}
-    for symbol in symbols:
-        signal = process_symbol(symbol, interval, period, with_technical, execute, indicator_settings, trading_style)
-        if signal:
-            results[symbol] = signal
+    if symbols:
+        with ThreadPoolExecutor(max_workers=min(MAX_SYMBOL_WORKERS, len(symbols))) as executor:
+            for symbol, signal in zip(symbols, executor.map(process, symbols)):
+                if signal:
+                    results[symbol] = signal
     
     # If we processed multiple symbols, save a summary file
     if len(results) > 1:
-        timestamp = datetime.now().strftime('%Y%m%d')
+        timestamp = run_timestamp.strftime('%Y%m%d')
         summary = {
-            "timestamp": datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
+            "timestamp": run_timestamp.strftime('%Y-%m-%dT%H:%M:%SZ'),
             "symbols_processed": len(symbols),
             "signals_generated": len(results),
             "interval": interval,
             "period": period,
             "trading_style": trading_style,
-            "signals_summary": {}
-        }
-        
-        # Create a condensed summary of each signal
-        for symbol, signal in results.items():
-            summary["signals_summary"][symbol] = {
-                "action": signal.get("suggested_action", "unknown"),
-                "confidence": signal.get("pattern_confidence", "unknown"),
-                "pattern": signal.get("pattern_identified", "unknown")
+            # Condensed summary of each signal
+            "signals_summary": {
+                symbol: {field: signal.get(key, "unknown") for field, key in SUMMARY_FIELDS}
+                for symbol, signal in results.items()
             }
+        }
         
-        # Save the summary
+        # Save the summary in the background; nothing reads it back during the run
         file_path = os.path.join(OUTPUTS_DIR, f"summary_{timestamp}.json")
-        with open(file_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        enqueue_write(file_path, json_dumps(summary, indent=True))
         
-        main_logger.info(f"Saved summary for {len(results)} signals to {file_path}")
+        main_logger.info("Queued summary for %d signals to %s", len(results), file_path)
     
     return results
 
+# Command line arguments that override a top-level indicator setting of the same name
+_SIMPLE_SETTING_ARGS = ('sma', 'ema', 'rsi', 'atr')
+
+# Nested indicator settings and the (argument, field) pairs that override them
+_NESTED_SETTING_ARGS = {
+    'macd': (('macd_fast', 'fast'), ('macd_slow', 'slow'), ('macd_signal', 'signal')),
+    'bollinger': (('bb_period', 'period'), ('bb_std', 'std_dev'))
+}
+
+_CUSTOM_SETTING_ARGS = _SIMPLE_SETTING_ARGS + tuple(
+    name for fields in _NESTED_SETTING_ARGS.values() for name, _ in fields
+)
+
 def parse_indicator_settings(args):
     """
     Parse command line arguments into indicator settings dict.
@@ -176,59 +269,29 @@ def parse_indicator_settings(args):
         dict: Custom indicator settings or None if using defaults
     """
     # Check if any custom indicator settings were provided
-    has_custom_settings = (
-        args.sma is not None or 
-        args.ema is not None or 
-        args.rsi is not None or 
-        args.macd_fast is not None or
-        args.macd_slow is not None or
-        args.macd_signal is not None or
-        args.bb_period is not None or
-        args.bb_std is not None or
-        args.atr is not None
-    )
-    
-    if not has_custom_settings:
+    if not any(getattr(args, name) is not None for name in _CUSTOM_SETTING_ARGS):
         return None
     
     # Start with the default settings
     settings = TECHNICAL_SETTINGS.copy()
     
     # Update with custom values
-    if args.sma is not None:
-        settings['sma'] = args.sma
-    
-    if args.ema is not None:
-        settings['ema'] = args.ema
-    
-    if args.rsi is not None:
-        settings['rsi'] = args.rsi
-    
-    if args.macd_fast is not None or args.macd_slow is not None or args.macd_signal is not None:
-        macd_settings = settings['macd'].copy()
-        if args.macd_fast is not None:
-            macd_settings['fast'] = args.macd_fast
-        if args.macd_slow is not None:
-            macd_settings['slow'] = args.macd_slow
-        if args.macd_signal is not None:
-            macd_settings['signal'] = args.macd_signal
-        settings['macd'] = macd_settings
-    
-    if args.bb_period is not None or args.bb_std is not None:
-        bb_settings = settings['bollinger'].copy()
-        if args.bb_period is not None:
-            bb_settings['period'] = args.bb_period
-        if args.bb_std is not None:
-            bb_settings['std_dev'] = args.bb_std
-        settings['bollinger'] = bb_settings
-    
-    if args.atr is not None:
-        settings['atr'] = args.atr
+    for name in _SIMPLE_SETTING_ARGS:
+        value = getattr(args, name)
+        if value is not None:
+            settings[name] = value
+    
+    # Merge nested overrides into a new dict so TECHNICAL_SETTINGS is left untouched
+    for key, fields in _NESTED_SETTING_ARGS.items():
+        overrides = {field: getattr(args, name) for name, field in fields if getattr(args, name) is not None}
+        if overrides:
+            settings[key] = {**settings[key], **overrides}
     
     return settings
 
-def main():
-    """Main function to parse arguments and run the appropriate process."""
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command line parser once; repeated main() calls reuse it."""
     parser = argparse.ArgumentParser(description='Trading Signals Generator')
     
     parser.add_argument('--symbols', nargs='+', default=DEFAULT_SYMBOLS,
@@ -281,20 +344,25 @@ def main():
     parser.add_argument('--atr', type=int,
                         help='Custom ATR period (e.g., --atr 14)')
     
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main function to parse arguments and run the appropriate process."""
+    args = _build_parser().parse_args()
     
     # Parse custom indicator settings
     indicator_settings = parse_indicator_settings(args)
+    run_timestamp = datetime.now()
     
     # Log the starting configuration
-    main_logger.info(f"Starting Trading Signals Generator")
-    main_logger.info(f"Using interval: {args.interval}, period: {args.period}, trading style: {args.trading_style}")
+    main_logger.info("Starting Trading Signals Generator")
+    main_logger.info("Using interval: %s, period: %s, trading style: %s", args.interval, args.period, args.trading_style)
     if indicator_settings:
-        main_logger.info(f"Using custom indicator settings")
+        main_logger.info("Using custom indicator settings")
     
     # Process a single symbol if specified
     if args.symbol:
-        main_logger.info(f"Processing single symbol: {args.symbol}")
+        main_logger.info("Processing single symbol: %s", args.symbol)
         signal = process_symbol(
             args.symbol, 
             args.interval,
@@ -302,20 +370,23 @@ def main():
             not args.skip_technical,
             args.execute,
             indicator_settings,
-            args.trading_style
+            args.trading_style,
+            run_timestamp=run_timestamp
         )
         if signal:
+            fields = _signal_fields(signal)
             print(f"\nTrading Signal for {args.symbol}:")
-            print(f"Action: {signal.get('suggested_action', 'unknown')}")
-            print(f"Pattern: {signal.get('pattern_identified', 'unknown')} ({signal.get('pattern_confidence', 'unknown')})")
-            print(f"Entry: {signal.get('entry_price', 'N/A')}")
-            print(f"Stop Loss: {signal.get('stop_loss', 'N/A')}")
-            print(f"Take Profit: {signal.get('take_profit', 'N/A')}")
+            print(f"Action: {fields.suggested_action}")
+            print(f"Pattern: {fields.pattern_identified} ({fields.pattern_confidence})")
+            print(f"Entry: {fields.entry_price}")
+            print(f"Stop Loss: {fields.stop_loss}")
+            print(f"Take Profit: {fields.take_profit}")
             print(f"Timeframe: {args.interval} chart with {args.period} history")
             print(f"Trading Style: {args.trading_style}")
     else:
         # Process multiple symbols
-        main_logger.info(f"Processing {len(args.symbols)} symbols: {', '.join(args.symbols)}")
+        if main_logger.isEnabledFor(logging.INFO):
+            main_logger.info("Processing %d symbols: %s", len(args.symbols), ', '.join(args.symbols))
         signals = process_multiple_symbols(
             args.symbols, 
             args.interval,
@@ -323,7 +394,8 @@ def main():
             not args.skip_technical,
             args.execute,
             indicator_settings,
-            args.trading_style
+            args.trading_style,
+            run_timestamp=run_timestamp
         )
         
         # Print a simple summary to the console
@@ -331,7 +403,8 @@ def main():
         print(f"Timeframe: {args.interval} chart with {args.period} history")
         print(f"Trading Style: {args.trading_style}")
         for symbol, signal in signals.items():
-            print(f"{symbol}: {signal.get('suggested_action', 'unknown')} ({signal.get('pattern_confidence', 'unknown')})")
+            fields = _signal_fields(signal)
+            print(f"{symbol}: {fields.suggested_action} ({fields.pattern_confidence})")
     
     main_logger.info("Trading Signals Generator completed")
 
@@ -1,8 +1,12 @@
 """
 Enhanced prompt generator with improved modularity for different timeframes.
 """
-import json
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from src.utils.cache import prune_cached, read_cached, write_cached
+from src.utils.file_utils import json_dumps
 from src.utils.logger import signals_logger
 from src.analysis.patterns import (
     analyze_trend,
@@ -16,349 +20,388 @@ from src.analysis.technical import (
     generate_overall_summary
 )
 
-def prepare_medium_term_prompt(data, symbol, interval):
+# Static prompt scaffolding for each trading style, serialized once into _STYLES below
+
+# Medium term
+_MEDIUM_ROLE = {
+    "role": "Experienced Technical Analyst",
+    "expertise": "Medium-term market analysis focusing on swing trading opportunities",
+    "approach": "Balanced analysis of technical indicators, price action, and market structure",
+    "time_horizon": "5-20 days holding period",
+    "risk_management": "Emphasis on favorable risk-reward ratios with clear stop loss levels",
+    "analysis_style": "Objective, data-driven with focus on probability rather than certainty"
+}
+
+_MEDIUM_RESPONSE_FORMAT = {
+    "pattern_identified": "<pattern_name>",
+    "pattern_confidence": "<low/medium/high>",
+    "suggested_action": "<buy/sell/hold>",
+    "entry_price": "<calculated_entry_price>",
+    "stop_loss": "<calculated_stop_loss>",
+    "take_profit": "<calculated_take_profit>",
+    "risk_reward_ratio": "<calculated_ratio>",
+    "reasoning": "<evidence-based_reasoning_for_decision>",
+    "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
+    "timeframe": "<expected_holding_period>"
+}
+
+_MEDIUM_RESPONSE_INSTRUCTIONS = {
+    "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
+    "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
+    "example": {
+        "pattern_identified": "Uptrend Continuation",
+        "pattern_confidence": "medium",
+        "suggested_action": "buy",
+        "entry_price": "388.50",
+        "stop_loss": "382.34",
+        "take_profit": "394.00",
+        "risk_reward_ratio": "1:1.1",
+        "reasoning": "Price is in an uptrend with bullish signals from the SMA 20, SMA 50, and MACD.",
+        "alternative_scenario": "If price falls below 382.34, analysis is invalidated.",
+        "timeframe": "5-20 days"
+    },
+    "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
+}
+
+_MEDIUM_GUIDELINES = {
+    "entry_stop_tp": "Calculate a specific entry price using technical levels and recent volatility instead of simply using the current price. Likewise, determine stop loss and take profit levels based on a defined risk-reward ratio.",
+    "bearish_pressure": "Explain bearish pressure clearly by discussing its impact on trend strength and how it might conflict with bullish signals, including the implications for the trade setup.",
+    "resistance_breakout": "If the current price exceeds identified resistance levels, explicitly state that a resistance breakout has occurred, differentiating between a true breakout and a potential fakeout.",
+    "alternative_scenario": "Detail alternative scenarios by explaining that a break below the calculated stop loss would invalidate the analysis, thus requiring re-assessment of the trade.",
+    "risk_reward": "Provide refined risk-reward calculations by explicitly computing the ratio based on the differences between the calculated entry price, stop loss, and take profit levels."
+}
+
+# Short term
+_SHORT_ROLE = {
+    "role": "Day Trader and Technical Analyst",
+    "expertise": "Short-term market analysis focusing on intraday and multi-day opportunities",
+    "approach": "Emphasis on momentum, volatility, and quick price movements",
+    "time_horizon": "Hours to 5 days holding period",
+    "risk_management": "Tight stop losses and quick profit taking",
+    "analysis_style": "Reactive to price action and volume with emphasis on entry/exit timing"
+}
+
+_SHORT_RESPONSE_FORMAT = {
+    "pattern_identified": "<pattern_name>",
+    "pattern_confidence": "<low/medium/high>",
+    "suggested_action": "<buy/sell/hold>",
+    "entry_price": "<calculated_entry_price>",
+    "stop_loss": "<calculated_stop_loss>",
+    "take_profit": "<calculated_take_profit>",
+    "risk_reward_ratio": "<calculated_ratio>",
+    "reasoning": "<evidence-based_reasoning_for_decision>",
+    "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
+    "timeframe": "<expected_holding_period_in_hours_or_days>"
+}
+
+_SHORT_RESPONSE_INSTRUCTIONS = {
+    "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
+    "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
+    "example": {
+        "pattern_identified": "Breakout",
+        "pattern_confidence": "high",
+        "suggested_action": "buy",
+        "entry_price": "388.50",
+        "stop_loss": "386.75",
+        "take_profit": "392.00",
+        "risk_reward_ratio": "1:2",
+        "reasoning": "Price breaking above resistance with increasing volume and positive momentum.",
+        "alternative_scenario": "If price falls back below breakout level, exit the trade.",
+        "timeframe": "1-2 days"
+    },
+    "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
+}
+
+_SHORT_GUIDELINES = {
+    "entry_timing": "Focus on precise entry timing based on intraday price action and volume confirmation.",
+    "stop_placement": "Keep stops tight but outside normal market noise levels, typically using recent swing points or volatility measures.",
+    "aggressive_targets": "For short-term trades, consider multiple profit targets to capture quick moves while allowing for potential continuation.",
+    "momentum_emphasis": "Pay special attention to momentum indicators like RSI, Stochastics, and MACD for short-term trade direction.",
+    "market_conditions": "Clearly identify if the current market environment favors day trading or if volatility is too low for effective short-term trades."
+}
+
+# Long term
+_LONG_ROLE = {
+    "role": "Strategic Investment Analyst",
+    "expertise": "Long-term market analysis focusing on position trading opportunities",
+    "approach": "Emphasis on macro trends, fundamental confluence, and significant technical levels",
+    "time_horizon": "Weeks to months holding period",
+    "risk_management": "Wider but calculated stop losses with strategic position sizing",
+    "analysis_style": "Patient, trend-following with focus on high-probability setups"
+}
+
+_LONG_RESPONSE_FORMAT = {
+    "pattern_identified": "<pattern_name>",
+    "pattern_confidence": "<low/medium/high>",
+    "suggested_action": "<buy/sell/hold>",
+    "entry_price": "<calculated_entry_price_or_range>",
+    "stop_loss": "<calculated_stop_loss>",
+    "take_profit": "<calculated_take_profit_or_targets>",
+    "risk_reward_ratio": "<calculated_ratio>",
+    "reasoning": "<evidence-based_reasoning_for_decision>",
+    "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
+    "timeframe": "<expected_holding_period_in_weeks_or_months>"
+}
+
+_LONG_RESPONSE_INSTRUCTIONS = {
+    "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
+    "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
+    "example": {
+        "pattern_identified": "Major Uptrend Continuation",
+        "pattern_confidence": "high",
+        "suggested_action": "buy",
+        "entry_price": "385.00-390.00",
+        "stop_loss": "365.00",
+        "take_profit": "425.00",
+        "risk_reward_ratio": "1:1.75",
+        "reasoning": "Price in confirmed uptrend above all major moving averages with healthy pullback to support.",
+        "alternative_scenario": "If price breaks below the 200-day moving average, the long-term bullish thesis is invalidated.",
+        "timeframe": "3-6 months"
+    },
+    "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
+}
+
+_LONG_GUIDELINES = {
+    "trend_confirmation": "Emphasize the importance of multiple timeframe confirmation for long-term trends.",
+    "strategic_entry": "Consider scaling into positions at key technical levels rather than single entry points.",
+    "broad_market_context": "Factor in broader market conditions and sector performance in the analysis.",
+    "moving_average_emphasis": "Pay special attention to the relationship between price and longer-term moving averages (50, 100, 200-day).",
+    "prepare_for_volatility": "Address how to handle normal market volatility during the expected longer holding period."
+}
+
+def _json_fragment(value):
+    """Serialize a value as it appears one level deep in an indent=2 JSON document."""
+    return json_dumps(value, indent=True).decode().replace('\n', '\n  ')
+
+def _dump_prompt(fields):
     """
-    Prepare a prompt for medium-term trading analysis.
+    Serialize prompt fields to the same text as dumping the whole prompt with indent=2.
     
     Args:
-        data (dict): Data dictionary with 'bars' key containing price data
-        symbol (str): Stock symbol
-        interval (str): Time interval
+        fields: (key, fragment) pairs in output order, each fragment already serialized
+            with _json_fragment
     
     Returns:
         str: JSON prompt for OpenAI
     """
-    try:
-        # First, make sure we have data to work with
-        if not data or 'bars' not in data or not data['bars']:
-            signals_logger.error(f"No bars in data for prompt generation for {symbol}")
-            return None
-            
-        signals_logger.info(f"Preparing medium_term prompt for {symbol}")
-        
-        # Define the LLM's role and approach
-        role_definition = {
-            "role": "Experienced Technical Analyst",
-            "expertise": "Medium-term market analysis focusing on swing trading opportunities",
-            "approach": "Balanced analysis of technical indicators, price action, and market structure",
-            "time_horizon": "5-20 days holding period",
-            "risk_management": "Emphasis on favorable risk-reward ratios with clear stop loss levels",
-            "analysis_style": "Objective, data-driven with focus on probability rather than certainty"
-        }
-        
-        # Extract key market data
-        price_summary = extract_price_summary(data)
-        
-        # Prepare the prompt structure
-        prompt = {
-            "role_definition": role_definition,
-            "task": f"Analyze market data and technical indicators to generate medium term trading signals for {symbol}.",
-            "symbol": symbol,
-            "interval": interval,
-            "market_data": price_summary,
-            "technical_analysis": {},
-            "trading_style": "medium_term",
-            "expected_response_format": {
-                "pattern_identified": "<pattern_name>",
-                "pattern_confidence": "<low/medium/high>",
-                "suggested_action": "<buy/sell/hold>",
-                "entry_price": "<calculated_entry_price>",
-                "stop_loss": "<calculated_stop_loss>",
-                "take_profit": "<calculated_take_profit>",
-                "risk_reward_ratio": "<calculated_ratio>",
-                "reasoning": "<evidence-based_reasoning_for_decision>",
-                "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
-                "timeframe": "<expected_holding_period>"
-            },
-            "response_instructions": {
-                "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
-                "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
-                "example": {
-                    "pattern_identified": "Uptrend Continuation",
-                    "pattern_confidence": "medium",
-                    "suggested_action": "buy",
-                    "entry_price": "388.50",
-                    "stop_loss": "382.34",
-                    "take_profit": "394.00",
-                    "risk_reward_ratio": "1:1.1",
-                    "reasoning": "Price is in an uptrend with bullish signals from the SMA 20, SMA 50, and MACD.",
-                    "alternative_scenario": "If price falls below 382.34, analysis is invalidated.",
-                    "timeframe": "5-20 days"
-                },
-                "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
-            }
-        }
-        
-        # Add trend analysis
-        trend_analysis = analyze_trend(data, focus="medium_term")
-        prompt["technical_analysis"]["trend_analysis"] = trend_analysis
-        
-        # Add support and resistance levels
-        support_resistance = analyze_support_resistance(data)
-        prompt["technical_analysis"]["support_resistance"] = support_resistance
-        
-        # Add volume analysis
-        volume_analysis = analyze_volume(data)
-        if volume_analysis:
-            prompt["technical_analysis"]["volume_analysis"] = volume_analysis
-        
-        # Add breakout detection
-        breakouts = detect_breakouts(data, support_resistance)
-        if breakouts:
-            prompt["technical_analysis"]["breakouts"] = breakouts
-        
-        # Generate market context
-        market_context = generate_market_context(data)
-        prompt["market_context"] = market_context
-        
-        # Generate an overall summary
-        summary = generate_overall_summary(data, trend_analysis, breakouts)
-        prompt["technical_analysis"]["overall_summary"] = summary
+    return "{\n" + ",\n".join(f'  "{key}": {fragment}' for key, fragment in fields) + "\n}"
 
-        # Add additional guidelines for the LLM to improve the analysis
-        prompt["analysis_guidelines"] = {
-            "entry_stop_tp": "Calculate a specific entry price using technical levels and recent volatility instead of simply using the current price. Likewise, determine stop loss and take profit levels based on a defined risk-reward ratio.",
-            "bearish_pressure": "Explain bearish pressure clearly by discussing its impact on trend strength and how it might conflict with bullish signals, including the implications for the trade setup.",
-            "resistance_breakout": "If the current price exceeds identified resistance levels, explicitly state that a resistance breakout has occurred, differentiating between a true breakout and a potential fakeout.",
-            "alternative_scenario": "Detail alternative scenarios by explaining that a break below the calculated stop loss would invalidate the analysis, thus requiring re-assessment of the trade.",
-            "risk_reward": "Provide refined risk-reward calculations by explicitly computing the ratio based on the differences between the calculated entry price, stop loss, and take profit levels."
-        }
-        
-        # Convert to JSON string
-        return json.dumps(prompt, indent=2)
+def _style_config(style, role, response_format, response_instructions, guidelines, lookback, volume_periods):
+    """Bundle a trading style's analysis parameters with its serialized scaffolding."""
+    return {
+        "task": f"Analyze market data and technical indicators to generate {style.replace('_', ' ')} trading signals for ",
+        "lookback": lookback,
+        "volume_periods": volume_periods,
+        # Serialized once so each call only encodes the parts that depend on the data
+        "style_json": _json_fragment(style),
+        "role_json": _json_fragment(role),
+        "response_format_json": _json_fragment(response_format),
+        "response_instructions_json": _json_fragment(response_instructions),
+        "guidelines_json": _json_fragment(guidelines)
+    }
+
+# Everything that differs between the trading styles
+_STYLES = {
+    "medium_term": _style_config("medium_term", _MEDIUM_ROLE, _MEDIUM_RESPONSE_FORMAT, _MEDIUM_RESPONSE_INSTRUCTIONS,
+                                 _MEDIUM_GUIDELINES, lookback=20, volume_periods=10),
+    "short_term": _style_config("short_term", _SHORT_ROLE, _SHORT_RESPONSE_FORMAT, _SHORT_RESPONSE_INSTRUCTIONS,
+                                _SHORT_GUIDELINES, lookback=10, volume_periods=5),
+    "long_term": _style_config("long_term", _LONG_ROLE, _LONG_RESPONSE_FORMAT, _LONG_RESPONSE_INSTRUCTIONS,
+                               _LONG_GUIDELINES, lookback=50, volume_periods=20)
+}
+
+# Subdirectory of CACHE_DIR holding finished prompts, keyed by a hash of the bars. Entries
+# only need to outlive a rerun within the same bar, so they expire after a day and the
+# oldest are pruned past PROMPT_CACHE_MAX_ENTRIES
+PROMPT_CACHE_NAMESPACE = 'prompts'
+PROMPT_CACHE_TTL = 24 * 60 * 60
+PROMPT_CACHE_MAX_ENTRIES = 500
+
+# Analysis results kept for reuse when the same bars are prompted more than once,
+# e.g. one symbol prepared under several trading styles
+ANALYSIS_CACHE_SIZE = 64
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+def _cached_analysis(func, data, bars_digest, **kwargs):
+    """
+    Run an analysis function over data, reusing the result for the same bars and arguments.
     
-    except Exception as e:
-        signals_logger.error(f"Error preparing medium_term prompt for {symbol}: {e}")
-        return None
+    Entries are keyed on a digest of the bars' content, so bars edited in place get a new
+    key and the cache holds no references to the bars themselves.
+    
+    Args:
+        func: Analysis function taking data plus keyword arguments
+        data (dict): Data dictionary with 'bars' key containing price data
+        bars_digest (str): Digest of the serialized bars
+        **kwargs: Hashable keyword arguments for func
+    
+    Returns:
+        The analysis result, shared with other callers; treat it as read-only
+    """
+    key = (func.__name__, bars_digest, tuple(sorted(kwargs.items())))
+    
+    with _analysis_cache_lock:
+        if key in _analysis_cache:
+            _analysis_cache.move_to_end(key)
+            return _analysis_cache[key]
+    
+    result = func(data, **kwargs)
+    
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    
+    return result
 
+def _bars_or_none(data, symbol):
+    """
+    Get the bars from a data dictionary, logging an error when there are none.
+    
+    Args:
+        data (dict): Data dictionary with 'bars' key containing price data
+        symbol (str): Stock symbol, for the log message
     
-def prepare_short_term_prompt(data, symbol, interval):
+    Returns:
+        list: The bars, or None if data is missing or has no bars
     """
-    Prepare a prompt for short-term trading analysis.
+    bars = (data or {}).get('bars')
+    if not bars:
+        signals_logger.error("No bars in data for prompt generation for %s", symbol)
+        return None
+    return bars
+
+def _prepare_prompt(data, symbol, interval, style, force=False):
+    """
+    Prepare a prompt for the given trading style.
     
     Args:
         data (dict): Data dictionary with 'bars' key containing price data
         symbol (str): Stock symbol
         interval (str): Time interval
+        style (str): 'short_term', 'medium_term', or 'long_term'
+        force (bool): Rebuild the prompt even if one is cached for this data
     
     Returns:
         str: JSON prompt for OpenAI
     """
     try:
         # First, make sure we have data to work with
-        if not data or 'bars' not in data or not data['bars']:
-            signals_logger.error(f"No bars in data for prompt generation for {symbol}")
+        if not _bars_or_none(data, symbol):
             return None
             
-        signals_logger.info(f"Preparing short_term prompt for {symbol}")
+        signals_logger.info("Preparing %s prompt for %s", style, symbol)
+        config = _STYLES[style]
         
-        # Define the LLM's role and approach
-        role_definition = {
-            "role": "Day Trader and Technical Analyst",
-            "expertise": "Short-term market analysis focusing on intraday and multi-day opportunities",
-            "approach": "Emphasis on momentum, volatility, and quick price movements",
-            "time_horizon": "Hours to 5 days holding period",
-            "risk_management": "Tight stop losses and quick profit taking",
-            "analysis_style": "Reactive to price action and volume with emphasis on entry/exit timing"
-        }
+        # Prompts are a pure function of the bars, so unchanged bars (a rerun within the
+        # same bar) are served from disk without redoing the analysis or serialization.
+        # The rest of data is left out: its metadata carries fetch and processing
+        # timestamps that change on every run.
+        bars_digest = hashlib.blake2b(json_dumps(data['bars']), digest_size=16).hexdigest()
+        cache_key = hashlib.blake2b(
+            f"{symbol}|{interval}|{style}|{data.get('symbol')}|{bars_digest}".encode(), digest_size=16
+        ).hexdigest()
+        if not force:
+            cached = read_cached(PROMPT_CACHE_NAMESPACE, cache_key, PROMPT_CACHE_TTL)
+            if cached is not None:
+                return cached
         
         # Extract key market data
-        price_summary = extract_price_summary(data)
+        price_summary = _cached_analysis(extract_price_summary, data, bars_digest)
         
-        # Prepare the prompt structure
-        prompt = {
-            "role_definition": role_definition,
-            "task": f"Analyze market data and technical indicators to generate short term trading signals for {symbol}.",
-            "symbol": symbol,
-            "interval": interval,
-            "market_data": price_summary,
-            "technical_analysis": {},
-            "trading_style": "short_term",
-            "expected_response_format": {
-                "pattern_identified": "<pattern_name>",
-                "pattern_confidence": "<low/medium/high>",
-                "suggested_action": "<buy/sell/hold>",
-                "entry_price": "<calculated_entry_price>",
-                "stop_loss": "<calculated_stop_loss>",
-                "take_profit": "<calculated_take_profit>",
-                "risk_reward_ratio": "<calculated_ratio>",
-                "reasoning": "<evidence-based_reasoning_for_decision>",
-                "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
-                "timeframe": "<expected_holding_period_in_hours_or_days>"
-            },
-            "response_instructions": {
-                "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
-                "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
-                "example": {
-                    "pattern_identified": "Breakout",
-                    "pattern_confidence": "high",
-                    "suggested_action": "buy",
-                    "entry_price": "388.50",
-                    "stop_loss": "386.75",
-                    "take_profit": "392.00",
-                    "risk_reward_ratio": "1:2",
-                    "reasoning": "Price breaking above resistance with increasing volume and positive momentum.",
-                    "alternative_scenario": "If price falls back below breakout level, exit the trade.",
-                    "timeframe": "1-2 days"
-                },
-                "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
-            }
-        }
+        # Collect the technical analysis sections
+        technical_analysis = {}
         
         # Add trend analysis
-        trend_analysis = analyze_trend(data, focus="short_term")
-        prompt["technical_analysis"]["trend_analysis"] = trend_analysis
+        trend_analysis = _cached_analysis(analyze_trend, data, bars_digest, focus=style)
+        technical_analysis["trend_analysis"] = trend_analysis
         
         # Add support and resistance levels
-        support_resistance = analyze_support_resistance(data, lookback=10)
-        prompt["technical_analysis"]["support_resistance"] = support_resistance
+        support_resistance = _cached_analysis(analyze_support_resistance, data, bars_digest, lookback=config["lookback"])
+        technical_analysis["support_resistance"] = support_resistance
         
         # Add volume analysis
-        volume_analysis = analyze_volume(data, periods=5)
+        volume_analysis = _cached_analysis(analyze_volume, data, bars_digest, periods=config["volume_periods"])
         if volume_analysis:
-            prompt["technical_analysis"]["volume_analysis"] = volume_analysis
+            technical_analysis["volume_analysis"] = volume_analysis
         
         # Add breakout detection
         breakouts = detect_breakouts(data, support_resistance)
         if breakouts:
-            prompt["technical_analysis"]["breakouts"] = breakouts
+            technical_analysis["breakouts"] = breakouts
         
         # Generate market context
-        market_context = generate_market_context(data, focus="short_term")
-        prompt["market_context"] = market_context
+        market_context = _cached_analysis(generate_market_context, data, bars_digest, focus=style)
         
         # Generate an overall summary
-        summary = generate_overall_summary(data, trend_analysis, breakouts, focus="short_term")
-        prompt["technical_analysis"]["overall_summary"] = summary
+        summary = generate_overall_summary(data, trend_analysis, breakouts, focus=style)
+        technical_analysis["overall_summary"] = summary
 
-        # Add additional guidelines for the LLM to improve the analysis
-        prompt["analysis_guidelines"] = {
-            "entry_timing": "Focus on precise entry timing based on intraday price action and volume confirmation.",
-            "stop_placement": "Keep stops tight but outside normal market noise levels, typically using recent swing points or volatility measures.",
-            "aggressive_targets": "For short-term trades, consider multiple profit targets to capture quick moves while allowing for potential continuation.",
-            "momentum_emphasis": "Pay special attention to momentum indicators like RSI, Stochastics, and MACD for short-term trade direction.",
-            "market_conditions": "Clearly identify if the current market environment favors day trading or if volatility is too low for effective short-term trades."
-        }
+        # Assemble the JSON prompt, splicing in the pre-serialized static scaffolding
+        prompt = _dump_prompt((
+            ("role_definition", config["role_json"]),
+            ("task", _json_fragment(f"{config['task']}{symbol}.")),
+            ("symbol", _json_fragment(symbol)),
+            ("interval", _json_fragment(interval)),
+            ("market_data", _json_fragment(price_summary)),
+            ("technical_analysis", _json_fragment(technical_analysis)),
+            ("trading_style", config["style_json"]),
+            ("expected_response_format", config["response_format_json"]),
+            ("response_instructions", config["response_instructions_json"]),
+            ("market_context", _json_fragment(market_context)),
+            ("analysis_guidelines", config["guidelines_json"])
+        ))
         
-        # Convert to JSON string
-        return json.dumps(prompt, indent=2)
+        write_cached(PROMPT_CACHE_NAMESPACE, cache_key, prompt)
+        prune_cached(PROMPT_CACHE_NAMESPACE, PROMPT_CACHE_MAX_ENTRIES)
+        return prompt
     
     except Exception as e:
-        signals_logger.error(f"Error preparing short_term prompt for {symbol}: {e}")
+        signals_logger.error(f"Error preparing {style} prompt for {symbol}: {e}")
         return None
 
+def prepare_medium_term_prompt(data, symbol, interval, force=False):
+    """
+    Prepare a prompt for medium-term trading analysis.
+    
+    Args:
+        data (dict): Data dictionary with 'bars' key containing price data
+        symbol (str): Stock symbol
+        interval (str): Time interval
+        force (bool): Rebuild the prompt even if one is cached for this data
+    
+    Returns:
+        str: JSON prompt for OpenAI
+    """
+    return _prepare_prompt(data, symbol, interval, "medium_term", force=force)
 
-def prepare_long_term_prompt(data, symbol, interval):
+def prepare_short_term_prompt(data, symbol, interval, force=False):
     """
-    Prepare a prompt for long-term trading analysis.
+    Prepare a prompt for short-term trading analysis.
     
     Args:
         data (dict): Data dictionary with 'bars' key containing price data
         symbol (str): Stock symbol
         interval (str): Time interval
+        force (bool): Rebuild the prompt even if one is cached for this data
     
     Returns:
         str: JSON prompt for OpenAI
     """
-    try:
-        # First, make sure we have data to work with
-        if not data or 'bars' not in data or not data['bars']:
-            signals_logger.error(f"No bars in data for prompt generation for {symbol}")
-            return None
-            
-        signals_logger.info(f"Preparing long_term prompt for {symbol}")
-        
-        # Define the LLM's role and approach
-        role_definition = {
-            "role": "Strategic Investment Analyst",
-            "expertise": "Long-term market analysis focusing on position trading opportunities",
-            "approach": "Emphasis on macro trends, fundamental confluence, and significant technical levels",
-            "time_horizon": "Weeks to months holding period",
-            "risk_management": "Wider but calculated stop losses with strategic position sizing",
-            "analysis_style": "Patient, trend-following with focus on high-probability setups"
-        }
-        
-        # Extract key market data
-        price_summary = extract_price_summary(data)
-        
-        # Prepare the prompt structure
-        prompt = {
-            "role_definition": role_definition,
-            "task": f"Analyze market data and technical indicators to generate long term trading signals for {symbol}.",
-            "symbol": symbol,
-            "interval": interval,
-            "market_data": price_summary,
-            "technical_analysis": {},
-            "trading_style": "long_term",
-            "expected_response_format": {
-                "pattern_identified": "<pattern_name>",
-                "pattern_confidence": "<low/medium/high>",
-                "suggested_action": "<buy/sell/hold>",
-                "entry_price": "<calculated_entry_price_or_range>",
-                "stop_loss": "<calculated_stop_loss>",
-                "take_profit": "<calculated_take_profit_or_targets>",
-                "risk_reward_ratio": "<calculated_ratio>",
-                "reasoning": "<evidence-based_reasoning_for_decision>",
-                "alternative_scenario": "<conditions_which_invalidate_the_analysis>",
-                "timeframe": "<expected_holding_period_in_weeks_or_months>"
-            },
-            "response_instructions": {
-                "format": "Please provide your analysis as a valid JSON object that matches the expected_response_format exactly.",
-                "requirements": "Ensure all fields are included in your response, including the symbol, pattern_identified, pattern_confidence, and suggested_action.",
-                "example": {
-                    "pattern_identified": "Major Uptrend Continuation",
-                    "pattern_confidence": "high",
-                    "suggested_action": "buy",
-                    "entry_price": "385.00-390.00",
-                    "stop_loss": "365.00",
-                    "take_profit": "425.00",
-                    "risk_reward_ratio": "1:1.75",
-                    "reasoning": "Price in confirmed uptrend above all major moving averages with healthy pullback to support.",
-                    "alternative_scenario": "If price breaks below the 200-day moving average, the long-term bullish thesis is invalidated.",
-                    "timeframe": "3-6 months"
-                },
-                "important_note": "Respond ONLY with the JSON object. Do not include any additional text, explanations, or markdown formatting outside the JSON structure."
-            }
-        }
-        
-        # Add trend analysis
-        trend_analysis = analyze_trend(data, focus="long_term")
-        prompt["technical_analysis"]["trend_analysis"] = trend_analysis
-        
-        # Add support and resistance levels
-        support_resistance = analyze_support_resistance(data, lookback=50)
-        prompt["technical_analysis"]["support_resistance"] = support_resistance
-        
-        # Add volume analysis
-        volume_analysis = analyze_volume(data, periods=20)
-        if volume_analysis:
-            prompt["technical_analysis"]["volume_analysis"] = volume_analysis
-        
-        # Add breakout detection
-        breakouts = detect_breakouts(data, support_resistance)
-        if breakouts:
-            prompt["technical_analysis"]["breakouts"] = breakouts
-        
-        # Generate market context
-        market_context = generate_market_context(data, focus="long_term")
-        prompt["market_context"] = market_context
-        
-        # Generate an overall summary
-        summary = generate_overall_summary(data, trend_analysis, breakouts, focus="long_term")
-        prompt["technical_analysis"]["overall_summary"] = summary
+    return _prepare_prompt(data, symbol, interval, "short_term", force=force)
 
-        # Add additional guidelines for the LLM to improve the analysis
-        prompt["analysis_guidelines"] = {
-            "trend_confirmation": "Emphasize the importance of multiple timeframe confirmation for long-term trends.",
-            "strategic_entry": "Consider scaling into positions at key technical levels rather than single entry points.",
-            "broad_market_context": "Factor in broader market conditions and sector performance in the analysis.",
-            "moving_average_emphasis": "Pay special attention to the relationship between price and longer-term moving averages (50, 100, 200-day).",
-            "prepare_for_volatility": "Address how to handle normal market volatility during the expected longer holding period."
-        }
-        
-        # Convert to JSON string
-        return json.dumps(prompt, indent=2)
+def prepare_long_term_prompt(data, symbol, interval, force=False):
+    """
+    Prepare a prompt for long-term trading analysis.
     
-    except Exception as e:
-        signals_logger.error(f"Error preparing long_term prompt for {symbol}: {e}")
-        return None
\ No newline at end of file
+    Args:
+        data (dict): Data dictionary with 'bars' key containing price data
+        symbol (str): Stock symbol
+        interval (str): Time interval
+        force (bool): Rebuild the prompt even if one is cached for this data
+    
+    Returns:
+        str: JSON prompt for OpenAI
+    """
+    return _prepare_prompt(data, symbol, interval, "long_term", force=force)
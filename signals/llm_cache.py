@@ -0,0 +1,28 @@
+"""
+On-disk cache for LLM trading signal responses, keyed on the prompt.
+"""
+from signals.llm_signals import get_trading_signal
+from src.utils.cache import file_cache
+
+# Prompts embed the latest bars, so an identical prompt means identical market data;
+# the TTL only bounds how long a stale answer can linger after the model changes.
+# Every distinct prompt adds an entry, so the oldest are pruned past LLM_CACHE_MAX_ENTRIES
+LLM_CACHE_TTL = 60 * 60
+LLM_CACHE_MAX_ENTRIES = 500
+
+def _is_parsed_signal(signal):
+    """Only cache responses that parsed as JSON; text fallbacks are worth retrying."""
+    return isinstance(signal, dict) and 'error' not in signal
+
+@file_cache('llm', ttl=LLM_CACHE_TTL, cache_if=_is_parsed_signal, max_entries=LLM_CACHE_MAX_ENTRIES)
+def cached_get_trading_signal(prompt):
+    """
+    Get a trading signal for a prompt, reusing the stored response for an identical prompt.
+    
+    Args:
+        prompt (str): JSON prompt for OpenAI
+    
+    Returns:
+        dict: Trading signal response or None if error
+    """
+    return get_trading_signal(prompt)
@@ -52,17 +52,6 @@ def get_trading_signal(prompt):
                     'temperature': 0
                 }
             
-            # Save the trading signal
-            try:
-                file_path = save_to_json(
-                    trading_signal, 
-                    OUTPUTS_DIR, 
-                    f"{trading_signal['metadata']['symbol']}_signal"
-                )
-                signals_logger.info(f"Saved trading signal to {file_path}")
-            except Exception as e:
-                signals_logger.error(f"Error saving trading signal: {e}")
-            
             return trading_signal
                 
         except json.JSONDecodeError:
@@ -92,6 +81,37 @@ def get_trading_signal(prompt):
         signals_logger.error(f"Error getting trading signal: {e}")
         return None
 
+def save_trading_signal(trading_signal, timestamp=None):
+    """
+    Save a trading signal to OUTPUTS_DIR.
+    
+    Kept separate from get_trading_signal so callers that serve signals from a cache
+    still record every run.
+    
+    Args:
+        trading_signal (dict): Trading signal with 'metadata' containing the symbol
+        timestamp (str): Timestamp for the filename, so it can match the one stored in
+            the signal's metadata (defaults to the current time)
+    
+    Returns:
+        str: Path to the saved file or None if error
+    """
+    try:
+        prefix = f"{trading_signal['metadata']['symbol']}_signal"
+        if timestamp:
+            prefix = f"{prefix}_{timestamp}"
+        file_path = save_to_json(
+            trading_signal, 
+            OUTPUTS_DIR, 
+            prefix,
+            include_timestamp=not timestamp
+        )
+        signals_logger.info(f"Saved trading signal to {file_path}")
+        return file_path
+    except Exception as e:
+        signals_logger.error(f"Error saving trading signal: {e}")
+        return None
+
 # Example Usage
 if __name__ == '__main__':
     # This is just an example of how to use this module
@@ -104,6 +124,7 @@ if __name__ == '__main__':
     data = fetch_intraday_data(symbol, interval)
     prompt = prepare_llm_prompt(data, symbol, interval)
     trading_signal = get_trading_signal(prompt)
+    save_trading_signal(trading_signal)
     
     print("LLM Trading Signal:")
     print(json.dumps(trading_signal, indent=2))
\ No newline at end of file
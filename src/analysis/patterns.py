@@ -127,14 +127,6 @@ def analyze_trend(data, periods=10, focus="medium_term"):
             analysis_logger.warning(f"Not enough bars for trend analysis (need {periods}, got {len(bars) if bars else 0})")
             return {"trend": "unknown", "strength": 0}
         
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame(bars)
-        
-        # Make sure columns are numeric
-        for col in ['o', 'h', 'l', 'c']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col])
-        
         # Extract key data for analysis
         latest = bars[-1]
         
@@ -226,15 +218,12 @@ def analyze_trend(data, periods=10, focus="medium_term"):
             
         momentum = "Unknown"
         if len(bars) >= recent_lookback:
-            recent_changes = []
-            for i in range(1, min(recent_lookback, len(bars))):
-                curr_idx = len(bars) - i
-                prev_idx = len(bars) - i - 1
-                if curr_idx >= 0 and prev_idx >= 0:
-                    recent_changes.append(bars[curr_idx]['c'] - bars[prev_idx]['c'])
+            recent_closes = np.fromiter((bar['c'] for bar in bars[-recent_lookback:]),
+                                        dtype=np.float64, count=recent_lookback)
+            recent_changes = np.diff(recent_closes)
             
-            positive_changes = sum(1 for change in recent_changes if change > 0)
-            negative_changes = sum(1 for change in recent_changes if change < 0)
+            positive_changes = int((recent_changes > 0).sum())
+            negative_changes = int((recent_changes < 0).sum())
             
             if positive_changes >= int(recent_lookback * 0.7):
                 momentum = "Strongly Bullish"
@@ -289,30 +278,21 @@ def analyze_support_resistance(data, lookback=20):
         bars_to_analyze = bars[-min(lookback, len(bars)):]
         
         # Find significant price levels by looking for areas of price congestion
-        price_points = []
-        for bar in bars_to_analyze:
-            price_points.extend([bar['h'], bar['l']])
-        
-        # Group prices into clusters
-        price_points.sort()
-        zones = []
-        
-        if price_points:
-            current_zone = [price_points[0]]
-            latest_close = bars[-1]['c']
-            zone_threshold = latest_close * 0.005  # 0.5% threshold for zone detection
-            
-            for price in price_points[1:]:
-                if price - current_zone[-1] < zone_threshold:
-                    current_zone.append(price)
-                else:
-                    if len(current_zone) > 3:  # Consider it a significant zone if multiple touches
-                        zones.append(sum(current_zone) / len(current_zone))
-                    current_zone = [price]
-            
-            # Add the last zone if significant
-            if len(current_zone) > 3:
-                zones.append(sum(current_zone) / len(current_zone))
+        count = len(bars_to_analyze)
+        highs = np.fromiter((bar['h'] for bar in bars_to_analyze), dtype=np.float64, count=count)
+        lows = np.fromiter((bar['l'] for bar in bars_to_analyze), dtype=np.float64, count=count)
+        price_points = np.sort(np.concatenate([highs, lows]))
+        
+        # Group prices into clusters: a new zone starts wherever the gap to the
+        # previous price reaches the threshold
+        latest_close = bars[-1]['c']
+        zone_threshold = latest_close * 0.005  # 0.5% threshold for zone detection
+        starts = np.r_[0, np.flatnonzero(np.diff(price_points) >= zone_threshold) + 1]
+        counts = np.diff(np.r_[starts, len(price_points)])
+        means = np.add.reduceat(price_points, starts) / counts
+        
+        # Consider it a significant zone if multiple touches
+        zones = means[counts > 3].tolist()
         
         # Separate into support and resistance based on current price
         current_price = bars[-1]['c']
@@ -2,13 +2,15 @@
 Technical analysis functions using TA-Lib for processing market data.
 Enhanced with support for custom indicator settings based on timeframe.
 """
+import copy
 import numpy as np
 import pandas as pd
 import talib as ta
 from datetime import datetime
+from functools import lru_cache
 
 from src.utils.config import PROCESSED_DATA_DIR, TECHNICAL_SETTINGS
-from src.utils.file_utils import save_to_json
+from src.utils.file_utils import save_bars_parquet, save_to_json
 from src.utils.logger import analysis_logger
 
 def calculate_technical_indicators(data, settings=None):
@@ -173,13 +175,9 @@ def calculate_technical_indicators(data, settings=None):
     else:
         analysis_logger.warning(f"Not enough bars to calculate MFI. Need {mfi_period}, have {len(df)}")
     
-    # Round all values to 2 decimal places (except timestamp)
-    for col in df.columns:
-        if col != 't' and df[col].dtype != 'object':
-            df[col] = df[col].round(2)
-    
-    # Handle NaN values
-    df = df.fillna(0)
+    # Round all values to 2 decimal places in one block operation (DataFrame.round
+    # leaves the timestamp and other non-numeric columns untouched), then handle NaN values
+    df = df.round(2).fillna(0)
     
     # Convert back to dictionary
     data['bars'] = df.to_dict('records')
@@ -227,10 +225,16 @@ def calculate_technical_indicators(data, settings=None):
     file_path = save_to_json(
         data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_{interval}_processed"
+        f"{symbol}_{interval}_processed",
+        indent=False
     )
     analysis_logger.info(f"Saved processed data with TA-Lib indicators to {file_path}")
     
+    # Columnar copy of the bars so the dashboard can load only the columns it charts
+    parquet_path = save_bars_parquet(df, file_path)
+    if parquet_path:
+        analysis_logger.info(f"Saved processed bars to {parquet_path}")
+    
     return data
 
 def process_multiple_symbols(data_dict, settings=None):
@@ -265,8 +269,15 @@ def get_timeframe_adjusted_settings(interval):
     Returns:
         dict: Adjusted technical indicator settings
     """
-    # Copy default settings
-    settings = TECHNICAL_SETTINGS.copy()
+    # Hand out a deep copy so callers can override keys, including the nested macd and
+    # bollinger settings, without touching the cached copy
+    return copy.deepcopy(_timeframe_adjusted_settings(interval))
+
+@lru_cache(maxsize=None)
+def _timeframe_adjusted_settings(interval):
+    """Build the adjusted settings for an interval once; see get_timeframe_adjusted_settings."""
+    # Copy default settings, nested values included, so the cache never aliases them
+    settings = copy.deepcopy(TECHNICAL_SETTINGS)
     
     # Adjust settings based on timeframe
     if interval in ['1m', '2m', '3m']:
@@ -334,8 +345,9 @@ def analyze_volume(data, periods=10):
             return None
         
         # Extract recent volumes
-        recent_volumes = [bar['v'] for bar in bars[-periods:]]
-        avg_volume = sum(recent_volumes) / len(recent_volumes)
+        recent_bars = bars[-periods:]
+        recent_volumes = np.fromiter((bar['v'] for bar in recent_bars), dtype=np.float64, count=len(recent_bars))
+        avg_volume = recent_volumes.mean().item()
         latest_volume = bars[-1]['v']
         
         # Determine if volume is increasing or decreasing
@@ -366,11 +378,13 @@ def analyze_volume(data, periods=10):
             
         # Calculate volume-weighted average price (VWAP) if needed
         vwap = None
-        if all('o' in bar and 'h' in bar and 'l' in bar and 'c' in bar and 'v' in bar for bar in bars[-periods:]):
+        if all('o' in bar and 'h' in bar and 'l' in bar and 'c' in bar and 'v' in bar for bar in recent_bars):
             try:
-                typical_prices = [(bar['h'] + bar['l'] + bar['c']) / 3 for bar in bars[-periods:]]
-                volumes = [bar['v'] for bar in bars[-periods:]]
-                vwap = sum(tp * vol for tp, vol in zip(typical_prices, volumes)) / sum(volumes)
+                typical_prices = np.fromiter(((bar['h'] + bar['l'] + bar['c']) / 3 for bar in recent_bars),
+                                             dtype=np.float64, count=len(recent_bars))
+                total_volume = recent_volumes.sum()
+                if total_volume:
+                    vwap = (typical_prices @ recent_volumes / total_volume).item()
             except Exception as e:
                 analysis_logger.warning(f"Failed to calculate VWAP: {e}")
         
@@ -418,8 +432,12 @@ def extract_price_summary(data):
         # Extract key data points
         latest = bars[-1]
         first = bars[0]
-        high_of_period = max(candle['h'] for candle in bars)
-        low_of_period = min(candle['l'] for candle in bars)
+        # Index back into the bars so the reported values keep their original types
+        count = len(bars)
+        highs = np.fromiter((candle['h'] for candle in bars), dtype=np.float64, count=count)
+        lows = np.fromiter((candle['l'] for candle in bars), dtype=np.float64, count=count)
+        high_of_period = bars[int(highs.argmax())]['h']
+        low_of_period = bars[int(lows.argmin())]['l']
         
         return {
             "start_time": first['t'],
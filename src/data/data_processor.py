@@ -83,7 +83,8 @@ def resample_data(data, target_interval):
     file_path = save_to_json(
         resampled_data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_{target_interval}_resampled"
+        f"{symbol}_{target_interval}_resampled",
+        indent=False
     )
     data_logger.info(f"Saved resampled data to {file_path}")
     
@@ -146,7 +147,8 @@ def filter_market_hours(data, market_open='09:30:00', market_close='16:00:00', t
     file_path = save_to_json(
         filtered_data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_market_hours_only"
+        f"{symbol}_market_hours_only",
+        indent=False
     )
     data_logger.info(f"Saved market hours filtered data to {file_path}")
     
@@ -209,7 +211,8 @@ def merge_data_sources(data_list, symbol):
     file_path = save_to_json(
         merged_data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_merged"
+        f"{symbol}_merged",
+        indent=False
     )
     data_logger.info(f"Saved merged data to {file_path}")
     
@@ -292,7 +295,8 @@ def fill_missing_data(data, method='linear'):
     file_path = save_to_json(
         filled_data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_{method}_filled"
+        f"{symbol}_{method}_filled",
+        indent=False
     )
     data_logger.info(f"Saved filled data to {file_path}")
     
@@ -368,7 +372,8 @@ def normalize_volume(data, method='z-score'):
     file_path = save_to_json(
         normalized_data, 
         PROCESSED_DATA_DIR, 
-        f"{symbol}_{method}_normalized"
+        f"{symbol}_{method}_normalized",
+        indent=False
     )
     data_logger.info(f"Saved volume normalized data to {file_path}")
     
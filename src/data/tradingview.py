@@ -2,39 +2,63 @@
 TradingView data fetcher module (using Yahoo Finance as the data source).
 """
 import json
-from src.data.yahoo_fetcher import fetch_yahoo_data
+from src.data.yahoo_fetcher import fetch_yahoo_data, fetch_yahoo_data_batch
 from src.utils.logger import data_logger
 
-def fetch_intraday_data(symbol, interval='5m'):
+# Map between different interval formats if needed
+INTERVAL_MAPPING = {
+    '5Min': '5m',
+    '15Min': '15m', 
+    '30Min': '30m',
+    '1H': '1h'
+}
+
+def fetch_intraday_data(symbol, interval='5m', period='1d', save_intermediate=True):
     """
     Fetch intraday data for a symbol using Yahoo Finance.
     
     Args:
         symbol (str): Stock symbol (e.g., 'AAPL')
         interval (str): Time interval ('1m', '5m', '15m', etc.)
+        period (str): How far back to get data
+        save_intermediate (bool): Whether to write the raw bars to RAW_DATA_DIR
     
     Returns:
         dict: Data in the format expected by the signal generator or None if error
     """
     data_logger.info(f"Fetching intraday data for {symbol} at {interval} interval")
     
-    # Map between different interval formats if needed
-    interval_mapping = {
-        '5Min': '5m',
-        '15Min': '15m', 
-        '30Min': '30m',
-        '1H': '1h'
-    }
-    
     # Convert interval format if needed
-    yahoo_interval = interval_mapping.get(interval, interval)
+    yahoo_interval = INTERVAL_MAPPING.get(interval, interval)
     
     # Use Yahoo Finance to fetch the data
-    data = fetch_yahoo_data(symbol, interval=yahoo_interval, period='1d')
+    data = fetch_yahoo_data(symbol, interval=yahoo_interval, period=period,
+                            save_intermediate=save_intermediate)
     
     if data:
         data_logger.info(f"Successfully fetched {len(data['bars'])} bars for {symbol}")
     else:
         data_logger.error(f"Failed to fetch data for {symbol}")
     
-    return data
\ No newline at end of file
+    return data
+
+def fetch_intraday_data_batch(symbols, interval='5m', period='1d', save_intermediate=True):
+    """
+    Fetch intraday data for several symbols in one request.
+    
+    Args:
+        symbols (list): List of stock symbols
+        interval (str): Time interval ('1m', '5m', '15m', etc.)
+        period (str): How far back to get data
+        save_intermediate (bool): Whether to write each symbol's raw bars to RAW_DATA_DIR
+    
+    Returns:
+        dict: Dictionary mapping symbols to their data (symbols with no data are omitted)
+    """
+    data_logger.info(f"Fetching intraday data for {len(symbols)} symbols at {interval} interval")
+    
+    data = fetch_yahoo_data_batch(symbols, interval=INTERVAL_MAPPING.get(interval, interval),
+                                  period=period, save_intermediate=save_intermediate)
+    
+    data_logger.info(f"Successfully fetched data for {len(data)} out of {len(symbols)} symbols")
+    return data
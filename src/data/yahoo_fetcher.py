@@ -1,16 +1,110 @@
 """
 Yahoo Finance data fetcher module.
 """
-import traceback
+import time
+import logging
 from datetime import datetime
 import pandas as pd
 import yfinance as yf
 
+from src.utils.cache import file_cache
 from src.utils.config import RAW_DATA_DIR, DEFAULT_INTERVAL, DEFAULT_PERIOD
 from src.utils.file_utils import save_to_json
 from src.utils.logger import data_logger
 
-def fetch_yahoo_data(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD):
+# Daily and longer bars don't change during the session; intraday bars only change when
+# a new bar closes, so an entry stays fresh until the end of the bar it was fetched in
+DAILY_INTERVALS = {'1d', '5d', '1wk', '1mo', '3mo'}
+DAILY_FETCH_TTL = 6 * 60 * 60
+INTRADAY_FETCH_TTL = 60
+BAR_SECONDS = {'1m': 60, '2m': 120, '5m': 300, '15m': 900, '30m': 1800, '60m': 3600, '1h': 3600}
+
+# Intraday bars start from the 9:30 ET open, which is always on a half hour in UTC
+BAR_ALIGNMENT_OFFSET = 30 * 60
+
+def _fetch_ttl(arguments):
+    """Cache lifetime in seconds for a fetch_yahoo_data call."""
+    interval = arguments['interval']
+    if interval in DAILY_INTERVALS:
+        return DAILY_FETCH_TTL
+    
+    bar_seconds = BAR_SECONDS.get(interval)
+    if bar_seconds is None:
+        return INTRADAY_FETCH_TTL
+    
+    # Seconds since the current bar opened: anything cached before then missed a close
+    return (time.time() - BAR_ALIGNMENT_OFFSET) % bar_seconds
+
+def _build_bar_data(df, symbol, interval, period, save_intermediate):
+    """
+    Convert a downloaded single-symbol DataFrame into the bar format used by the pipeline.
+    
+    Args:
+        df (DataFrame): yfinance OHLCV frame for one symbol, indexed by date
+        symbol (str): Stock symbol
+        interval (str): Time interval of the bars
+        period (str): Historical period the bars cover
+        save_intermediate (bool): Whether to write the raw bars to RAW_DATA_DIR
+    
+    Returns:
+        dict: Data in the format expected by the signal generator
+    """
+    # Reset index to make Date/Datetime a column
+    df = df.reset_index()
+    
+    # Log the DataFrame structure for debugging
+    if data_logger.isEnabledFor(logging.DEBUG):
+        data_logger.debug("DataFrame columns: %s", df.columns.tolist())
+    
+    # Create a new DataFrame with the columns we need
+    processed_df = pd.DataFrame()
+    
+    # Handle the date column - check which column contains datetime information
+    if 'Datetime' in df.columns:
+        processed_df['t'] = df['Datetime'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    elif 'Date' in df.columns:
+        processed_df['t'] = df['Date'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    elif 'index' in df.columns and pd.api.types.is_datetime64_any_dtype(df['index']):
+        processed_df['t'] = df['index'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    else:
+        # Try the index itself as a last resort
+        processed_df['t'] = df.index.strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    # Add price and volume data
+    processed_df['o'] = df['Open']
+    processed_df['h'] = df['High']
+    processed_df['l'] = df['Low']
+    processed_df['c'] = df['Close']
+    processed_df['v'] = df['Volume']
+    
+    data_logger.info("Successfully retrieved %d bars of data for %s", len(processed_df), symbol)
+    
+    # Convert to the format we used with Alpaca
+    data = {
+        'bars': processed_df.to_dict('records'),
+        'symbol': symbol,
+        'metadata': {
+            'interval': interval,
+            'period': period,
+            'fetched_at': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'source': 'Yahoo Finance'
+        }
+    }
+    
+    # Save the raw data unless the caller persists its own processed copy
+    if save_intermediate:
+        file_path = save_to_json(
+            data, 
+            RAW_DATA_DIR, 
+            f"{symbol}_{interval}",
+            indent=False
+        )
+        data_logger.info("Saved raw data to %s", file_path)
+    
+    return data
+
+@file_cache('yahoo', ttl=_fetch_ttl)
+def fetch_yahoo_data(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD, save_intermediate=True):
     """
     Fetch data from Yahoo Finance.
     
@@ -18,12 +112,13 @@ def fetch_yahoo_data(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD):
         symbol (str): Stock symbol (e.g., 'AAPL')
         interval (str): Time interval ('1m', '5m', '15m', '1h', '1d', etc.)
         period (str): How far back to get data ('1d', '5d', '1mo', '3mo', etc.)
+        save_intermediate (bool): Whether to write the raw bars to RAW_DATA_DIR
     
     Returns:
         dict: Data in the format expected by the signal generator or None if error
     """
     try:
-        data_logger.info(f"Fetching {interval} data for {symbol} for the last {period}")
+        data_logger.info("Fetching %s data for %s for the last %s", interval, symbol, period)
         
         # Yahoo Finance uses slightly different ticker format for some indices
         if symbol == '^GSPC':
@@ -48,64 +143,77 @@ def fetch_yahoo_data(symbol, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD):
         
         # Check if data was successfully retrieved
         if df.empty:
-            data_logger.error(f"No data returned for {symbol}")
+            data_logger.error("No data returned for %s", symbol)
             return None
         
-        # Reset index to make Date/Datetime a column
-        df = df.reset_index()
-        
-        # Log the DataFrame structure for debugging
-        data_logger.debug(f"DataFrame columns: {df.columns.tolist()}")
-        
-        # Create a new DataFrame with the columns we need
-        processed_df = pd.DataFrame()
-        
-        # Handle the date column - check which column contains datetime information
-        if 'Datetime' in df.columns:
-            processed_df['t'] = df['Datetime'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-        elif 'Date' in df.columns:
-            processed_df['t'] = df['Date'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-        elif 'index' in df.columns and pd.api.types.is_datetime64_any_dtype(df['index']):
-            processed_df['t'] = df['index'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-        else:
-            # Try the index itself as a last resort
-            processed_df['t'] = df.index.strftime('%Y-%m-%dT%H:%M:%SZ')
-        
-        # Add price and volume data
-        processed_df['o'] = df['Open']
-        processed_df['h'] = df['High']
-        processed_df['l'] = df['Low']
-        processed_df['c'] = df['Close']
-        processed_df['v'] = df['Volume']
-        
-        data_logger.info(f"Successfully retrieved {len(processed_df)} bars of data for {symbol}")
-        
-        # Convert to the format we used with Alpaca
-        data = {
-            'bars': processed_df.to_dict('records'),
-            'symbol': symbol,
-            'metadata': {
-                'interval': interval,
-                'period': period,
-                'fetched_at': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
-                'source': 'Yahoo Finance'
-            }
-        }
+        return _build_bar_data(df, symbol, interval, period, save_intermediate)
+    
+    except Exception as e:
+        data_logger.error("Error fetching data from Yahoo Finance for %s: %s", symbol, e)
+        data_logger.debug("Traceback for %s", symbol, exc_info=True)
+        return None
+
+@file_cache('yahoo', ttl=_fetch_ttl)
+def fetch_yahoo_data_batch(symbols, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD, save_intermediate=True):
+    """
+    Fetch data for several symbols with a single Yahoo Finance download.
+    
+    Args:
+        symbols (list): List of stock symbols
+        interval (str): Time interval
+        period (str): Historical period
+        save_intermediate (bool): Whether to write each symbol's raw bars to RAW_DATA_DIR
+    
+    Returns:
+        dict: Dictionary mapping symbols to their data (symbols with no data are omitted)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return {}
+    
+    try:
+        data_logger.info("Fetching %s data for %d symbols for the last %s", interval, len(symbols), period)
         
-        # Save the data to a file
-        file_path = save_to_json(
-            data, 
-            RAW_DATA_DIR, 
-            f"{symbol}_{interval}"
+        # group_by='ticker' puts the symbol on the first column level, so df[symbol]
+        # is the same single-symbol frame that fetch_yahoo_data works with
+        df = yf.download(
+            tickers=symbols,
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            auto_adjust=True,
+            prepost=False,
+            threads=True,
+            progress=False
         )
-        data_logger.info(f"Saved raw data to {file_path}")
+    except Exception as e:
+        data_logger.error("Error fetching batch data from Yahoo Finance: %s", e)
+        data_logger.debug("Traceback for batch fetch", exc_info=True)
+        return {}
+    
+    results = {}
+    if df.empty:
+        data_logger.error("No data returned for %s", ', '.join(symbols))
+        return results
+    
+    tickers = set(df.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol not in tickers:
+            data_logger.error("No data returned for %s", symbol)
+            continue
+        
+        # Symbols that stopped trading earlier in the window leave all-NaN rows behind
+        symbol_df = df[symbol].dropna(how='all')
+        if symbol_df.empty:
+            data_logger.error("No data returned for %s", symbol)
+            continue
         
-        return data
+        try:
+            results[symbol] = _build_bar_data(symbol_df, symbol, interval, period, save_intermediate)
+        except Exception as e:
+            data_logger.error("Error processing Yahoo Finance data for %s: %s", symbol, e)
     
-    except Exception as e:
-        data_logger.error(f"Error fetching data from Yahoo Finance for {symbol}: {e}")
-        data_logger.debug(traceback.format_exc())
-        return None
+    return results
 
 def fetch_multiple_symbols(symbols, interval=DEFAULT_INTERVAL, period=DEFAULT_PERIOD):
     """
@@ -119,13 +227,9 @@ def fetch_multiple_symbols(symbols, interval=DEFAULT_INTERVAL, period=DEFAULT_PE
     Returns:
         dict: Dictionary mapping symbols to their data
     """
-    data_logger.info(f"Fetching data for {len(symbols)} symbols")
+    data_logger.info("Fetching data for %d symbols", len(symbols))
     
-    results = {}
-    for symbol in symbols:
-        data = fetch_yahoo_data(symbol, interval, period)
-        if data:
-            results[symbol] = data
+    results = fetch_yahoo_data_batch(symbols, interval, period)
     
-    data_logger.info(f"Successfully fetched data for {len(results)} out of {len(symbols)} symbols")
-    return results
\ No newline at end of file
+    data_logger.info("Successfully fetched data for %d out of %d symbols", len(results), len(symbols))
+    return results
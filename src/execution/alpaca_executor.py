@@ -3,16 +3,28 @@ Alpaca trading execution module.
 """
 import os
 import time
+import logging
 import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.utils.config import ALPACA_API_KEY, ALPACA_SECRET_KEY, RISK_PER_TRADE
+from src.utils.file_utils import json_loads
 from src.utils.logger import execution_logger
 
 # Determine if we're using paper trading or live trading
 PAPER_TRADING = True  # Set to False for live trading
 
 ALPACA_BASE_URL = "https://paper-api.alpaca.markets" if PAPER_TRADING else "https://api.alpaca.markets"
+ALPACA_DATA_URL = "https://data.alpaca.markets"
+
+# Alpaca's multi-symbol market data endpoints accept at most this many symbols per request
+MAX_SYMBOLS_PER_REQUEST = 100
+
+# Check the keys once at import rather than surfacing a 401 on the first call
+if not (ALPACA_API_KEY and ALPACA_SECRET_KEY):
+    execution_logger.warning("ALPACA_API_KEY / ALPACA_SECRET_KEY not set; Alpaca requests will be rejected")
 
 # Set up headers for Alpaca API
 HEADERS = {
@@ -20,6 +32,24 @@ HEADERS = {
     'APCA-API-SECRET-KEY': ALPACA_SECRET_KEY
 }
 
+# Shared session so calls reuse pooled keep-alive connections instead of a new TLS
+# handshake per request. Retries cover rate limits and transient server errors on reads
+# only: orders and position closes (POST/DELETE) are never resent automatically. Once
+# retries run out the last response is returned so callers still log its status code.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        raise_on_status=False
+    )
+))
+
 def check_account_status():
     """
     Check the status of the Alpaca trading account.
@@ -31,10 +61,10 @@ def check_account_status():
     
     try:
         execution_logger.info("Checking Alpaca account status")
-        response = requests.get(url, headers=HEADERS)
+        response = SESSION.get(url)
         
         if response.status_code == 200:
-            account_info = response.json()
+            account_info = json_loads(response.content)
             
             execution_logger.info(f"Account ID: {account_info.get('id')}")
             execution_logger.info(f"Account Status: {account_info.get('status')}")
@@ -62,10 +92,10 @@ def get_positions():
     
     try:
         execution_logger.info("Getting current positions")
-        response = requests.get(url, headers=HEADERS)
+        response = SESSION.get(url)
         
         if response.status_code == 200:
-            positions = response.json()
+            positions = json_loads(response.content)
             
             if positions:
                 execution_logger.info(f"Found {len(positions)} open positions")
@@ -106,10 +136,10 @@ def get_open_orders():
     
     try:
         execution_logger.info("Getting open orders")
-        response = requests.get(url, headers=HEADERS, params=params)
+        response = SESSION.get(url, params=params)
         
         if response.status_code == 200:
-            orders = response.json()
+            orders = json_loads(response.content)
             
             if orders:
                 execution_logger.info(f"Found {len(orders)} open orders")
@@ -194,10 +224,10 @@ def place_order(symbol, qty, side, order_type='market', time_in_force='day',
         if stop_loss is not None:
             execution_logger.info(f"Stop Loss: ${stop_loss.get('stop_price')}")
         
-        response = requests.post(url, headers=HEADERS, json=order_data)
+        response = SESSION.post(url, json=order_data)
         
         if response.status_code == 200:
-            order = response.json()
+            order = json_loads(response.content)
             
             execution_logger.info(f"Order placed successfully!")
             execution_logger.info(f"Order ID: {order.get('id')}")
@@ -213,7 +243,39 @@ def place_order(symbol, qty, side, order_type='market', time_in_force='day',
         execution_logger.error(f"Exception placing order: {e}")
         return None
 
-def execute_trading_signal(signal, symbol, risk_percentage=RISK_PER_TRADE):
+def get_latest_quotes(symbols):
+    """
+    Get the latest quotes for several symbols with one request per chunk of symbols.
+    
+    Args:
+        symbols (list): Symbols to quote
+    
+    Returns:
+        dict: Mapping of symbol to its latest quote (symbols without a quote are omitted)
+    """
+    url = f"{ALPACA_DATA_URL}/v2/stocks/quotes/latest"
+    symbols = list(dict.fromkeys(symbols))
+    quotes = {}
+    
+    for start in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST):
+        chunk = symbols[start:start + MAX_SYMBOLS_PER_REQUEST]
+        try:
+            execution_logger.info("Getting latest quotes for %d symbols", len(chunk))
+            response = SESSION.get(url, params={'symbols': ','.join(chunk)})
+            
+            if response.status_code == 200:
+                quotes.update(json_loads(response.content).get('quotes', {}))
+            else:
+                execution_logger.error("Error getting latest quotes: %s", response.status_code)
+                if execution_logger.isEnabledFor(logging.DEBUG):
+                    execution_logger.debug(response.text)
+        
+        except Exception as e:
+            execution_logger.error("Exception getting latest quotes: %s", e)
+    
+    return quotes
+
+def execute_trading_signal(signal, symbol, risk_percentage=RISK_PER_TRADE, account=None, latest_quote=None):
     """
     Execute a trading signal by placing an order with Alpaca.
     
@@ -221,6 +283,8 @@ def execute_trading_signal(signal, symbol, risk_percentage=RISK_PER_TRADE):
         signal (dict): Trading signal
         symbol (str): Symbol to trade
         risk_percentage (float): Percentage of portfolio to risk per trade
+        account (dict): Account information already fetched by the caller (optional)
+        latest_quote (dict): Latest quote for the symbol already fetched by the caller (optional)
     
     Returns:
         dict: Order details or None if error
@@ -258,7 +322,8 @@ def execute_trading_signal(signal, symbol, risk_percentage=RISK_PER_TRADE):
             # Continue with None values if conversion fails
         
         # Get account information for risk management
-        account = check_account_status()
+        if account is None:
+            account = check_account_status()
         
         if not account:
             execution_logger.error("Could not get account information. Aborting trade.")
@@ -269,19 +334,21 @@ def execute_trading_signal(signal, symbol, risk_percentage=RISK_PER_TRADE):
         
         # Get current price if entry price is not specified
         if not entry_price:
-            # Fetch the latest quote
-            url = f"https://data.alpaca.markets/v2/stocks/{symbol}/quotes/latest"
-            response = requests.get(url, headers=HEADERS)
+            # Fetch the latest quote unless the caller already has it
+            if latest_quote is None:
+                url = f"{ALPACA_DATA_URL}/v2/stocks/{symbol}/quotes/latest"
+                response = SESSION.get(url)
+                
+                if response.status_code == 200:
+                    latest_quote = json_loads(response.content).get('quote')
             
-            if response.status_code == 200:
-                quote = response.json()
-                if 'quote' in quote:
-                    bid_price = float(quote['quote'].get('bp', 0))
-                    ask_price = float(quote['quote'].get('ap', 0))
-                    
-                    if bid_price > 0 and ask_price > 0:
-                        entry_price = (bid_price + ask_price) / 2
-                        execution_logger.info(f"Using current market price: ${entry_price:.2f}")
+            if latest_quote:
+                bid_price = float(latest_quote.get('bp', 0))
+                ask_price = float(latest_quote.get('ap', 0))
+                
+                if bid_price > 0 and ask_price > 0:
+                    entry_price = (bid_price + ask_price) / 2
+                    execution_logger.info(f"Using current market price: ${entry_price:.2f}")
             
             if not entry_price:
                 execution_logger.error(f"Could not determine entry price for {symbol}. Aborting trade.")
@@ -378,13 +445,25 @@ def process_signals_batch(signals_dict, risk_per_trade=RISK_PER_TRADE):
             execution_logger.warning("User aborted live trading batch processing")
             return {}
     
+    # Fetch the account once and all latest quotes in batched requests, instead of
+    # one account and one quote round trip per signal
+    account = check_account_status()
+    if not account:
+        execution_logger.error("Could not get account information. Aborting batch.")
+        return {}
+    
+    actionable = [symbol for symbol, signal in signals_dict.items()
+                  if str(signal.get('suggested_action', '')).lower() in ('buy', 'sell')]
+    quotes = get_latest_quotes(actionable) if actionable else {}
+    
     orders = {}
     for symbol, signal in signals_dict.items():
         # Add a small delay between orders to avoid rate limits
         if orders:  # Not the first order
             time.sleep(1)
         
-        order = execute_trading_signal(signal, symbol, risk_per_trade)
+        order = execute_trading_signal(signal, symbol, risk_per_trade,
+                                       account=account, latest_quote=quotes.get(symbol))
         if order:
             orders[symbol] = order
     
@@ -405,10 +484,10 @@ def close_position(symbol):
     
     try:
         execution_logger.info(f"Closing position for {symbol}")
-        response = requests.delete(url, headers=HEADERS)
+        response = SESSION.delete(url)
         
         if response.status_code == 200:
-            order = response.json()
+            order = json_loads(response.content)
             
             execution_logger.info(f"Successfully closed position for {symbol}")
             execution_logger.info(f"Order ID: {order.get('id')}")
@@ -442,10 +521,10 @@ def close_all_positions():
                 execution_logger.warning("User aborted closing all positions")
                 return {}
         
-        response = requests.delete(url, headers=HEADERS)
+        response = SESSION.delete(url)
         
         if response.status_code == 200:
-            orders = response.json()
+            orders = json_loads(response.content)
             
             execution_logger.info(f"Successfully closed all positions")
             
@@ -476,10 +555,10 @@ def cancel_all_orders():
     
     try:
         execution_logger.info("Cancelling all orders")
-        response = requests.delete(url, headers=HEADERS)
+        response = SESSION.delete(url)
         
         if response.status_code == 200:
-            orders = response.json()
+            orders = json_loads(response.content)
             
             execution_logger.info(f"Successfully cancelled {len(orders)} orders")
             return orders
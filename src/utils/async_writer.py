@@ -0,0 +1,52 @@
+"""
+Background file writer so callers don't block on disk I/O for outputs nobody reads right away.
+"""
+import queue
+import atexit
+import threading
+
+from src.utils.file_utils import WRITE_BUFFER_SIZE
+from src.utils.logger import main_logger
+
+_queue = queue.Queue()
+_writer = None
+_writer_lock = threading.Lock()
+
+def _drain():
+    """Write queued files one at a time for the life of the process."""
+    while True:
+        path, data = _queue.get()
+        try:
+            with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+            main_logger.info("Wrote %s", path)
+        except OSError as e:
+            main_logger.error("Error writing %s: %s", path, e)
+        finally:
+            _queue.task_done()
+
+def enqueue_write(path, data):
+    """
+    Queue bytes to be written to a file by the background writer thread.
+    
+    The writer thread is started on first use, and pending writes are flushed
+    before the interpreter exits.
+    
+    Args:
+        path: Path of the file to write
+        data: Bytes to write
+    """
+    global _writer
+    
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_drain, name='async-writer', daemon=True)
+                _writer.start()
+                atexit.register(flush)
+    
+    _queue.put((path, data))
+
+def flush():
+    """Block until every queued write has been written."""
+    _queue.join()
@@ -0,0 +1,118 @@
+"""
+Filesystem cache for expensive, repeatable calls such as market data fetches.
+"""
+import os
+import time
+import heapq
+import hashlib
+import inspect
+import tempfile
+from functools import wraps
+
+from src.utils.config import CACHE_DIR
+from src.utils.file_utils import json_dumps, json_loads
+
+def file_cache(namespace, ttl, cache_if=None, max_entries=None):
+    """
+    Cache a function's JSON-serializable results on disk for a limited time.
+    
+    Results are keyed by the function name and its bound arguments (defaults
+    applied), so f('AAPL') and f('AAPL', interval='5m') share an entry when
+    '5m' is the default. Empty results (None, {}) are not cached so
+    failed fetches are retried on the next call.
+    
+    Args:
+        namespace: Subdirectory of CACHE_DIR to store entries in
+        ttl: Seconds an entry stays fresh, or a callable taking the bound
+            arguments as a dict and returning the seconds for that call
+        cache_if: Optional predicate on the result; results it rejects are returned
+            but not stored
+        max_entries: Optional cap on the entries kept in the namespace; the oldest
+            are pruned after each write
+    
+    Returns:
+        function: Decorator to apply to the function
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            
+            key = hashlib.md5(f"{func.__qualname__}|{sorted(arguments.items())!r}".encode()).hexdigest()
+            
+            # Serve a fresh entry from disk
+            cached = read_cached(namespace, key, ttl(arguments) if callable(ttl) else ttl)
+            if cached is not None:
+                return cached
+            
+            result = func(*args, **kwargs)
+            if result and (cache_if is None or cache_if(result)):
+                write_cached(namespace, key, result)
+                if max_entries is not None:
+                    prune_cached(namespace, max_entries)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+def read_cached(namespace, key, max_age=None):
+    """
+    Read a cache entry written by write_cached.
+    
+    Args:
+        namespace: Subdirectory of CACHE_DIR the entry lives in
+        key: Entry key, used as the file name
+        max_age: Seconds the entry stays fresh, or None for entries that never go stale
+    
+    Returns:
+        The cached value, or None if it is missing, stale or unreadable
+    """
+    path = os.path.join(CACHE_DIR, namespace, f"{key}.json")
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) >= max_age:
+            return None
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def write_cached(namespace, key, value):
+    """
+    Write a JSON-serializable cache entry atomically so concurrent readers never see a partial file.
+    
+    Args:
+        namespace: Subdirectory of CACHE_DIR to store the entry in
+        key: Entry key, used as the file name
+        value: Value to store
+    """
+    cache_dir = os.path.join(CACHE_DIR, namespace)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_dumps(value))
+        os.replace(tmp_path, os.path.join(cache_dir, f"{key}.json"))
+    except OSError:
+        pass
+
+def prune_cached(namespace, max_entries):
+    """
+    Delete the oldest entries in a namespace so at most max_entries remain.
+    
+    Args:
+        namespace: Subdirectory of CACHE_DIR to prune
+        max_entries: Number of most recently written entries to keep
+    """
+    try:
+        with os.scandir(os.path.join(CACHE_DIR, namespace)) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith('.json')]
+        if len(entries) > max_entries:
+            for _, path in heapq.nsmallest(len(entries) - max_entries, entries):
+                os.remove(path)
+    except OSError:
+        pass
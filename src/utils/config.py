@@ -21,9 +21,10 @@ SIGNALS_DIR = os.path.join(BASE_DIR, 'signals')
 PROMPTS_DIR = os.path.join(SIGNALS_DIR, 'prompts')
 OUTPUTS_DIR = os.path.join(SIGNALS_DIR, 'outputs')
 LOGS_DIR = os.path.join(BASE_DIR, 'logs')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')
 
 # Create directories if they don't exist
-DIRS_TO_CREATE = [RAW_DATA_DIR, PROCESSED_DATA_DIR, PROMPTS_DIR, OUTPUTS_DIR, LOGS_DIR]
+DIRS_TO_CREATE = [RAW_DATA_DIR, PROCESSED_DATA_DIR, PROMPTS_DIR, OUTPUTS_DIR, LOGS_DIR, CACHE_DIR]
 
 # Yahoo Finance settings
 DEFAULT_INTERVAL = '5m'  # Available: 1m, 5m, 15m, 30m, 60m, 1h, 1d, 1wk, 1mo
@@ -3,8 +3,66 @@ File utilities for managing data storage and retrieval.
 """
 import os
 import json
-from datetime import datetime
+from datetime import date, datetime
 from src.utils.config import DIRS_TO_CREATE
+from src.utils.logger import data_logger
+
+# Buffer size for JSON writes; documents are serialized up front and written in one call
+WRITE_BUFFER_SIZE = 1 << 20
+
+# orjson parses and serializes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """
+    Parse JSON from bytes or str, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as bytes or str
+    
+    Returns:
+        The parsed data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib json module may contain NaN/Infinity literals,
+            # which orjson rejects
+            pass
+    return json.loads(data)
+
+def _json_default(obj):
+    """Serialize types JSON lacks: dates and pandas Timestamps as ISO strings, numpy values via tolist()."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if type(obj).__module__ == 'numpy' and hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(obj, indent=False):
+    """
+    Serialize data to JSON bytes, using orjson when it is installed.
+    
+    Non-string dict keys are stringified, dates are written as ISO strings and numpy
+    arrays as lists; other unsupported types raise TypeError.
+    
+    Args:
+        obj: Data to serialize
+        indent: Whether to pretty-print with a two-space indent
+    
+    Returns:
+        bytes: The UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode()
 
 def create_directories():
     """Create the necessary directory structure for the project."""
@@ -13,7 +71,19 @@ def create_directories():
             os.makedirs(directory)
             print(f"Created directory: {directory}")
 
-def save_to_json(data, directory, filename_prefix, include_timestamp=True):
+def write_json(filepath, data, indent=True):
+    """
+    Serialize data and write it to a file in a single buffered write.
+    
+    Args:
+        filepath: Path of the file to write
+        data: Data to save
+        indent: Whether to pretty-print; pass False for files only read by code
+    """
+    with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(json_dumps(data, indent=indent))
+
+def save_to_json(data, directory, filename_prefix, include_timestamp=True, indent=True):
     """
     Save data to a JSON file.
     
@@ -22,6 +92,7 @@ def save_to_json(data, directory, filename_prefix, include_timestamp=True):
         directory: Directory to save to
         filename_prefix: Prefix for the filename
         include_timestamp: Whether to include a timestamp in the filename
+        indent: Whether to pretty-print; pass False for files only read by code
     
     Returns:
         str: Path to the saved file
@@ -40,11 +111,33 @@ def save_to_json(data, directory, filename_prefix, include_timestamp=True):
     filepath = os.path.join(directory, filename)
     
     # Save the data
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(filepath, data, indent=indent)
     
     return filepath
 
+def save_bars_parquet(df, json_path):
+    """
+    Save a bars DataFrame as a Parquet sibling of its JSON file.
+    
+    Args:
+        df: pandas DataFrame of bars
+        json_path: Path of the JSON file the bars were saved to
+    
+    Returns:
+        str: Path to the Parquet file, or None if it could not be written
+    """
+    parquet_path = os.path.splitext(json_path)[0] + '.parquet'
+    try:
+        df.to_parquet(parquet_path, compression='zstd', index=False)
+    except ImportError:
+        return None
+    except Exception as e:
+        # The JSON copy is already saved; the Parquet copy is optional
+        data_logger.warning("Could not save Parquet copy of %s: %s", json_path, e)
+        return None
+    
+    return parquet_path
+
 def load_from_json(filepath):
     """
     Load data from a JSON file.
@@ -58,8 +151,8 @@ def load_from_json(filepath):
     if not os.path.exists(filepath):
         return None
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = json_loads(f.read())
     
     return data
 